@@ -1,22 +1,20 @@
 import streamlit as st
 
+from exchange_rates import get_rate_table
+
 # -------------------------------
-# Currency Converter with Static Rates
+# Currency Converter with Shared Rates
 # -------------------------------
 
 st.set_page_config(page_title="💱 Currency Converter", page_icon="💱", layout="centered")
 
 st.title("💱 Currency Converter")
-st.markdown("Convert between INR, USD, EUR, GBP, and JPY with static rates.")
 
-# Static exchange rates (relative to 1 USD for simplicity)
-exchange_rates = {
-    "USD": 1.0,
-    "INR": 83.0,
-    "EUR": 0.93,
-    "GBP": 0.80,
-    "JPY": 147.5,
-}
+# Shared rate table (loaded from exchange_rates.json, cached process-wide)
+rate_table = get_rate_table()
+currencies = rate_table.currencies
+
+st.markdown(f"Convert between {', '.join(currencies[:-1])}, and {currencies[-1]} · rates as of {rate_table.as_of or 'n/a'}.")
 
 # -------------------------------
 # UI
@@ -26,14 +24,14 @@ col1, col2 = st.columns(2)
 with col1:
     from_currency = st.selectbox(
         "From Currency",
-        options=list(exchange_rates.keys()),
+        options=currencies,
         index=0,
     )
 
 with col2:
     to_currency = st.selectbox(
         "To Currency",
-        options=list(exchange_rates.keys()),
+        options=currencies,
         index=1,
     )
 
@@ -46,9 +44,7 @@ if st.button("Convert 🔄", use_container_width=True):
     if from_currency == to_currency:
         st.info("⚠️ Both currencies are the same, conversion not needed!")
     else:
-        # Convert to USD first, then to target currency
-        amount_in_usd = amount / exchange_rates[from_currency]
-        converted_amount = amount_in_usd * exchange_rates[to_currency]
+        converted_amount = rate_table.convert(amount, from_currency, to_currency)
 
         st.success(
             f"🎉 {amount:,.2f} {from_currency} = **{converted_amount:,.2f} {to_currency}**"
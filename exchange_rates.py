@@ -0,0 +1,57 @@
+# exchange_rates.py
+# Shared exchange-rate table for the billing and converter apps.
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+
+import streamlit as st
+
+# -------------------------
+# Config
+# -------------------------
+RATES_PATH = Path(os.environ.get("EXCHANGE_RATES_PATH", Path(__file__).with_name("exchange_rates.json")))
+RATES_TTL_SECONDS = 15 * 60  # re-read the rates file at most this often
+
+@dataclass(frozen=True)
+class RateTable:
+    """Units of each currency per one unit of `base`, from a single rates file."""
+    base: str
+    rates: dict
+    as_of: str
+    version: str  # content hash of the rates file; changes only when rates do
+
+    @property
+    def currencies(self) -> list:
+        return list(self.rates)
+
+    def rate(self, from_currency: str, to_currency: str) -> Decimal:
+        """Exact multiplier converting `from_currency` amounts into `to_currency`."""
+        return self.rates[to_currency] / self.rates[from_currency]
+
+    def convert(self, amount, from_currency: str, to_currency: str) -> float:
+        return float(Decimal(str(amount)) * self.rate(from_currency, to_currency))
+
+# -------------------------
+# Loading (process-wide, TTL cached)
+# -------------------------
+@st.cache_resource(ttl=RATES_TTL_SECONDS, show_spinner=False)
+def _load_rate_table(path: str) -> RateTable:
+    with open(path, "rb") as f:
+        raw_bytes = f.read()
+    raw = json.loads(raw_bytes)
+    rates = {code: Decimal(str(value)) for code, value in raw["rates"].items()}
+    if any(value <= 0 for value in rates.values()):
+        raise ValueError("exchange rates must be positive")
+    return RateTable(
+        base=raw.get("base", "USD"),
+        rates=rates,
+        as_of=raw.get("as_of", ""),
+        version=hashlib.sha256(raw_bytes).hexdigest()[:12],
+    )
+
+def get_rate_table() -> RateTable:
+    """Shared rate table; all sessions of all apps reuse one parsed copy."""
+    return _load_rate_table(str(RATES_PATH))
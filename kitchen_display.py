@@ -0,0 +1,49 @@
+# kitchen_display.py
+# Per-hub kitchen display: shows orders queued by restaurantbilling.py.
+import time
+import uuid
+from datetime import datetime
+
+import streamlit as st
+
+from kitchen_queue import ack_order, claim_orders, open_order_counts
+from menu_catalog import get_menu_catalog
+
+REFRESH_SECONDS = 5
+ORDERS_PER_SCREEN = 12
+
+st.set_page_config(page_title="Kitchen Display", page_icon="👨‍🍳", layout="wide")
+st.title("👨‍🍳 Kitchen Display")
+
+# Each browser tab is its own consumer; its claimed orders return to the
+# queue if the tab goes away and stops renewing the lease.
+if "kds_consumer" not in st.session_state:
+    st.session_state.kds_consumer = f"kds-{uuid.uuid4().hex[:8]}"
+
+hub = st.selectbox("Hub", get_menu_catalog()["hubs"])
+
+def bump(order_id: int):
+    if not ack_order(order_id, st.session_state.kds_consumer):
+        st.toast("Order was already picked up by another display.")
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def order_board():
+    orders = claim_orders(hub, st.session_state.kds_consumer, limit=ORDERS_PER_SCREEN)
+    waiting = open_order_counts().get(hub, 0)
+    st.caption(f"{waiting} open order(s) · refreshed {datetime.now().strftime('%H:%M:%S')}")
+
+    if not orders:
+        st.info("No orders waiting. 🎉")
+        return
+
+    cols = st.columns(4)
+    for i, order in enumerate(orders):
+        with cols[i % 4].container(border=True):
+            age_min = int((time.time() - order["created_at"]) // 60)
+            st.markdown(f"**{order['order_no']}** · {order['customer']}")
+            st.caption(f"{order['invoice_no']} · {age_min} min ago" + (" · ⚠️ resent" if order["redelivered"] else ""))
+            for item, qty in order["items"]:
+                st.write(f"{qty} × {item}")
+            st.button("✅ Bump", key=f"bump_{order['id']}", on_click=bump, args=(order["id"],), use_container_width=True)
+
+order_board()
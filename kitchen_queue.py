@@ -0,0 +1,147 @@
+# kitchen_queue.py
+# SQLite-backed order queue between the billing app and the kitchen displays.
+#
+# Billing only does a single INSERT per order; kitchen display pages claim
+# orders for their hub under a short lease and acknowledge them when bumped.
+# An order whose lease runs out (display closed, crashed, refreshed) becomes
+# claimable again, so every order is delivered at least once. Each submission
+# carries its own id; resending the same id is a no-op, while different
+# orders that share an invoice number are all kept. Bumped orders are
+# deleted DONE_RETENTION_SECONDS after they were done, a few per ack, so the
+# table stays about as large as the open backlog.
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+
+from sqlite_store import connect, write_transaction
+
+# -------------------------
+# Config
+# -------------------------
+QUEUE_DB_PATH = Path(os.environ.get("KITCHEN_QUEUE_DB", Path(__file__).with_name("kitchen_queue.sqlite3")))
+MAX_OPEN_ORDERS_PER_HUB = 200  # backpressure: refuse new orders beyond this
+DEFAULT_LEASE_SECONDS = 30
+DONE_RETENTION_SECONDS = 24 * 60 * 60  # keep bumped orders this long (recall, daily counts)
+PURGE_BATCH = 100                      # expired done orders deleted per ack
+
+class KitchenQueueFull(Exception):
+    """Raised when a hub already has MAX_OPEN_ORDERS_PER_HUB orders waiting."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    submission_id TEXT NOT NULL UNIQUE,
+    hub           TEXT NOT NULL,
+    invoice_no    TEXT NOT NULL,
+    payload       TEXT NOT NULL,
+    status        TEXT NOT NULL DEFAULT 'pending',  -- pending | claimed | done
+    created_at    REAL NOT NULL,
+    claimed_by    TEXT,
+    lease_until   REAL,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    done_at       REAL
+);
+-- open orders per hub in queue order; done rows never enter this index
+CREATE INDEX IF NOT EXISTS orders_open ON orders (hub, id) WHERE status != 'done';
+CREATE INDEX IF NOT EXISTS orders_done ON orders (done_at) WHERE status = 'done';
+"""
+
+def _connect(db_path=None) -> sqlite3.Connection:
+    return connect(db_path or QUEUE_DB_PATH, _SCHEMA)
+
+# -------------------------
+# Producer side (billing)
+# -------------------------
+def new_submission_id() -> str:
+    return uuid.uuid4().hex
+
+def submit_order(hub: str, invoice_no: str, order: dict, submission_id: str = None, db_path=None) -> bool:
+    """Queue an order for the hub's kitchen.
+
+    `submission_id` identifies this submission (a fresh one by default);
+    returns False if it was already queued (resubmits are no-ops).
+    Raises KitchenQueueFull when the hub's backlog is at capacity.
+    """
+    with closing(_connect(db_path)) as conn:
+        with write_transaction(conn):
+            (open_orders,) = conn.execute(
+                "SELECT COUNT(*) FROM orders WHERE hub = ? AND status != 'done'", (hub,)
+            ).fetchone()
+            if open_orders >= MAX_OPEN_ORDERS_PER_HUB:
+                raise KitchenQueueFull(f"{hub} already has {open_orders} open orders")
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO orders (submission_id, hub, invoice_no, payload, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (submission_id or new_submission_id(), hub, invoice_no, json.dumps(order), time.time()),
+            )
+    return cur.rowcount == 1
+
+# -------------------------
+# Consumer side (kitchen displays)
+# -------------------------
+def claim_orders(hub: str, consumer: str, limit: int = 20, lease_seconds: float = DEFAULT_LEASE_SECONDS, db_path=None) -> list:
+    """Claim (or renew) up to `limit` open orders for `consumer`, oldest first.
+
+    Orders already held by `consumer` are renewed; pending orders and orders
+    whose lease expired are taken over. Returns dicts with the decoded payload.
+    """
+    now = time.time()
+    with closing(_connect(db_path)) as conn:
+        with write_transaction(conn):
+            rows = conn.execute(
+                """
+                SELECT id, hub, invoice_no, payload, created_at, attempts, claimed_by FROM orders
+                WHERE hub = ? AND status != 'done' AND (status = 'pending' OR (status = 'claimed' AND (claimed_by = ? OR lease_until < ?)))
+                ORDER BY id LIMIT ?
+                """,
+                (hub, consumer, now, limit),
+            ).fetchall()
+            conn.executemany(
+                """
+                UPDATE orders SET status = 'claimed', claimed_by = ?, lease_until = ?,
+                    attempts = attempts + (CASE WHEN claimed_by IS ? THEN 0 ELSE 1 END)
+                WHERE id = ?
+                """,
+                [(consumer, now + lease_seconds, consumer, row["id"]) for row in rows],
+            )
+    return [
+        {
+            "id": row["id"],
+            "hub": row["hub"],
+            "invoice_no": row["invoice_no"],
+            "created_at": row["created_at"],
+            "redelivered": row["attempts"] > 0 and row["claimed_by"] != consumer,
+            **json.loads(row["payload"]),
+        }
+        for row in rows
+    ]
+
+def ack_order(order_id: int, consumer: str, db_path=None) -> bool:
+    """Mark an order done. Returns False if `consumer` no longer holds it."""
+    now = time.time()
+    with closing(_connect(db_path)) as conn:
+        cur = conn.execute(
+            "UPDATE orders SET status = 'done', done_at = ? WHERE id = ? AND status = 'claimed' AND claimed_by = ?",
+            (now, order_id, consumer),
+        )
+        _purge_done(conn, now - DONE_RETENTION_SECONDS, PURGE_BATCH)
+    return cur.rowcount == 1
+
+def _purge_done(conn: sqlite3.Connection, older_than: float, limit: int) -> int:
+    """Delete up to `limit` done orders bumped before `older_than`."""
+    cur = conn.execute(
+        "DELETE FROM orders WHERE id IN"
+        " (SELECT id FROM orders WHERE status = 'done' AND done_at < ? LIMIT ?)",
+        (older_than, limit),
+    )
+    return cur.rowcount
+
+def open_order_counts(db_path=None) -> dict:
+    """hub -> number of orders not yet bumped, for load indicators."""
+    with closing(_connect(db_path)) as conn:
+        rows = conn.execute("SELECT hub, COUNT(*) FROM orders WHERE status != 'done' GROUP BY hub").fetchall()
+    return {hub: count for hub, count in rows}
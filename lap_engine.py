@@ -0,0 +1,104 @@
+# lap_engine.py
+# Stopwatch and lap bookkeeping for stopwatch.py.
+#
+# Time comes from time.perf_counter_ns(): monotonic (unaffected by NTP or
+# manual clock changes) and integer nanoseconds, so totals never drift from
+# float rounding. Splits (time since start at each lap) and intervals (each
+# lap's own duration) are kept in compact int64 arrays, and the interval
+# statistics are updated per lap (Welford's method), so best/worst/mean/
+# stddev cost the same after ten laps or ten thousand.
+import math
+import time
+from array import array
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class LapTimer:
+    def __init__(self, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.started_ns = None    # clock reading at the last start; None while stopped
+        self.banked_ns = 0        # elapsed time from earlier start/stop runs
+        self.splits = array("q")     # elapsed ns at each lap
+        self.intervals = array("q")  # ns since the previous lap
+        # running interval statistics
+        self.best_lap = self.worst_lap = None  # 1-based lap numbers
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    # -------------------------
+    # Clock
+    # -------------------------
+    @property
+    def running(self) -> bool:
+        return self.started_ns is not None
+
+    def elapsed_ns(self) -> int:
+        if self.started_ns is None:
+            return self.banked_ns
+        return self.banked_ns + self.clock() - self.started_ns
+
+    def elapsed(self) -> float:
+        return self.elapsed_ns() / NS_PER_SECOND
+
+    def start(self):
+        if self.started_ns is None:
+            self.started_ns = self.clock()
+
+    def stop(self):
+        if self.started_ns is not None:
+            self.banked_ns = self.elapsed_ns()
+            self.started_ns = None
+
+    # -------------------------
+    # Laps
+    # -------------------------
+    def lap(self):
+        """Record a lap at the current elapsed time; returns its interval in ns.
+
+        While stopped, only a lap that adds time (the final split) is kept;
+        returns None otherwise.
+        """
+        split = self.elapsed_ns()
+        previous = self.splits[-1] if self.splits else 0
+        interval = split - previous
+        if not self.running and interval <= 0:
+            return None
+        self.splits.append(split)
+        self.intervals.append(interval)
+
+        n = len(self.intervals)
+        if self.best_lap is None or interval < self.intervals[self.best_lap - 1]:
+            self.best_lap = n
+        if self.worst_lap is None or interval > self.intervals[self.worst_lap - 1]:
+            self.worst_lap = n
+        delta = interval - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (interval - self._mean)
+        return interval
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    @property
+    def best_ns(self):
+        return self.intervals[self.best_lap - 1] if self.best_lap else None
+
+    @property
+    def worst_ns(self):
+        return self.intervals[self.worst_lap - 1] if self.worst_lap else None
+
+    @property
+    def mean_ns(self):
+        return self._mean if self.intervals else None
+
+    @property
+    def stddev_ns(self):
+        """Sample standard deviation of the lap intervals (0 for a single lap)."""
+        n = len(self.intervals)
+        if not n:
+            return None
+        return math.sqrt(self._m2 / (n - 1)) if n > 1 else 0.0
@@ -0,0 +1,52 @@
+# menu_catalog.py
+# Shared menu catalog for the billing app and the kitchen displays.
+import json
+import os
+from pathlib import Path
+
+import streamlit as st
+
+# -------------------------
+# Config
+# -------------------------
+MENU_CATALOG_PATH = Path(os.environ.get("MENU_CATALOG_PATH", Path(__file__).with_name("restaurant_menu.json")))
+
+# -------------------------
+# Loading (process-wide, keyed on the file's mtime)
+# -------------------------
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_menu_catalog(path: str, mtime_ns: int) -> dict:
+    """Parse the catalog file and build the hub -> items index.
+
+    `mtime_ns` is part of the cache key, so editing the file hot-reloads the
+    catalog on the next rerun while unchanged files are never re-parsed.
+    """
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    banner_colors, hub_items, prices, item_meta = {}, {}, {}, {}
+    for hub, hub_info in raw["hubs"].items():
+        banner_colors[hub] = hub_info.get("banner_color", "#FAFAFA")
+        rows = []
+        for item_name, info in hub_info["menu"].items():
+            price = float(info["price"])
+            rows.append((item_name, price, info.get("color", "#FFFFFF")))
+            prices[(hub, item_name)] = price
+            item_meta[(hub, item_name)] = (info.get("tax_class", "standard"), float(info.get("discount_pct", 0)))
+        hub_items[hub] = rows
+
+    return {
+        "version": f"{path}@{mtime_ns}",
+        "currency": raw.get("currency", "INR"),  # currency the catalog prices are in
+        "hubs": list(hub_items),
+        "banner_colors": banner_colors,
+        "items": hub_items,
+        "prices": prices,
+        "item_meta": item_meta,
+        # percent rates per tax class; "standard" follows the tax slider
+        "tax_classes": {k: float(v) for k, v in raw.get("tax_classes", {}).items()},
+    }
+
+def get_menu_catalog() -> dict:
+    """Shared parsed catalog; re-read only after the file changes."""
+    return load_menu_catalog(str(MENU_CATALOG_PATH), MENU_CATALOG_PATH.stat().st_mtime_ns)
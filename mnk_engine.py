@@ -0,0 +1,252 @@
+# mnk_engine.py
+# Generalized m,n,k-game (k in a row on a rows x cols board, e.g. 15x15
+# gomoku) with an alpha-beta computer player.
+#
+# Boards use the same (x_bits, o_bits) bitboard pair as tictactoe.py, with
+# cell index row * cols + col, so game.py can drive either module through
+# the same cell/play/check_winner/is_board_full/computer_move calls.
+import random
+import time
+
+from tictactoe import DIFFICULTIES, O, X
+
+WIN_SCORE = 10 ** 9
+BEAM_WIDTH = 12        # moves searched per node, best-ordered first
+TIME_BUDGET = 0.18     # seconds per computer move
+MAX_TT_ENTRIES = 500_000
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class MNKGame:
+    """Rules, precomputed line masks and search for one board geometry."""
+
+    EMPTY_BOARD = (0, 0)
+
+    def __init__(self, rows: int, cols: int, k: int):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.cells = rows * cols
+        self.full = (1 << self.cells) - 1
+
+        # every k-cell line (window) on the board, and the windows through each cell
+        self.windows = []
+        for r in range(rows):
+            for c in range(cols):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    er, ec = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= er < rows and 0 <= ec < cols:
+                        self.windows.append(sum(1 << ((r + dr * i) * cols + c + dc * i) for i in range(k)))
+        self.windows_at = [[w for w in self.windows if w >> cell & 1] for cell in range(self.cells)]
+
+        # candidate moves are empty cells within two steps of a stone
+        self.near = []
+        for cell in range(self.cells):
+            r, c = divmod(cell, cols)
+            self.near.append(sum(
+                1 << (rr * cols + cc)
+                for rr in range(max(0, r - 2), min(rows, r + 3))
+                for cc in range(max(0, c - 2), min(cols, c + 3))
+            ))
+
+        # window value by stone count: an open line of n stones is worth 10**(n-1)
+        self.value = [0] + [10 ** (n - 1) for n in range(1, k)]
+
+        rng = random.Random(rows * 10_000 + cols * 100 + k)  # fixed keys: stable hashes
+        self.zobrist = [(rng.getrandbits(64), rng.getrandbits(64)) for _ in range(self.cells)]
+        self.tt = {}
+
+    # -------------------------
+    # Rules
+    # -------------------------
+    def cell(self, board, idx):
+        if board[0] >> idx & 1:
+            return X
+        if board[1] >> idx & 1:
+            return O
+        return None
+
+    def play(self, board, idx, player):
+        bit = 1 << idx
+        return (board[0] | bit, board[1]) if player == X else (board[0], board[1] | bit)
+
+    def check_winner(self, board):
+        """Winner and the cells of a completed line, or (None, None)."""
+        for player, bits in ((X, board[0]), (O, board[1])):
+            for w in self.windows:
+                if bits & w == w:
+                    return player, [i for i in range(self.cells) if w >> i & 1]
+        return None, None
+
+    def is_board_full(self, board):
+        return board[0] | board[1] == self.full
+
+    def empty_cells(self, board):
+        occupied = board[0] | board[1]
+        return [i for i in range(self.cells) if not occupied >> i & 1]
+
+    # -------------------------
+    # Computer players
+    # -------------------------
+    def computer_move(self, board, player, difficulty="Unbeatable", rng=random, time_budget=TIME_BUDGET):
+        """Move for `player` at the given difficulty (see tictactoe.DIFFICULTIES)."""
+        if self.check_winner(board)[0] is not None or self.is_board_full(board):
+            return None
+        if rng.random() >= DIFFICULTIES[difficulty]:
+            me, opp = (board[0], board[1]) if player == X else (board[1], board[0])
+            moves = [m for _, m, _ in self._candidates(me, opp, self._candidate_mask(me | opp))]
+            return rng.choice(moves or self.empty_cells(board))
+        return self.best_move(board, player, time_budget)
+
+    def best_move(self, board, player, time_budget=TIME_BUDGET, max_depth=None):
+        """Alpha-beta negamax with iterative deepening within `time_budget` seconds.
+
+        Each iteration searches one ply deeper, reusing the transposition table
+        (keyed by Zobrist hash) for move ordering; the move from the deepest
+        completed iteration is returned.
+        """
+        me, opp = (board[0], board[1]) if player == X else (board[1], board[0])
+        occupied = me | opp
+        if not occupied:
+            return (self.rows // 2) * self.cols + self.cols // 2
+
+        cand = self._candidate_mask(occupied)
+        moves = self._candidates(me, opp, cand)
+        for _, move, wins in moves:
+            if wins:
+                return move
+
+        # zobrist[cell] is (X key, O key), so the table can be shared by both sides
+        h = 0
+        for cell in range(self.cells):
+            if board[0] >> cell & 1:
+                h ^= self.zobrist[cell][0]
+            elif board[1] >> cell & 1:
+                h ^= self.zobrist[cell][1]
+        color = 0 if player == X else 1
+        evaluation = self._evaluate(me, opp)
+
+        if len(self.tt) > MAX_TT_ENTRIES:
+            self.tt.clear()
+        deadline = time.perf_counter() + time_budget
+        best = moves[0][1]
+        depth = 1
+        while max_depth is None or depth <= max_depth:
+            try:
+                score, move = self._negamax(me, opp, depth, -WIN_SCORE - 1, WIN_SCORE + 1,
+                                             h, evaluation, cand, color, 0, deadline)
+            except SearchTimeout:
+                break
+            if move is not None:
+                best = move
+            if abs(score) >= WIN_SCORE - self.cells or depth >= self.cells - occupied.bit_count():
+                break  # forced result found, or searched to the end of the game
+            depth += 1
+        return best
+
+    # -------------------------
+    # Search internals (side to move is always `me`, of color `color`)
+    # -------------------------
+    def _candidate_mask(self, occupied):
+        cand = 0
+        bits = occupied
+        while bits:
+            low = bits & -bits
+            cand |= self.near[low.bit_length() - 1]
+            bits ^= low
+        return cand
+
+    def _evaluate(self, me, opp):
+        value = self.value
+        score = 0
+        for w in self.windows:
+            a = (me & w).bit_count()
+            b = (opp & w).bit_count()
+            if not b:
+                score += value[a]
+            elif not a:
+                score -= value[b]
+        return score
+
+    def _candidates(self, me, opp, cand):
+        """[(eval gain, move, wins), ...] best first; the gain counts both the
+        lines `me` extends and the opponent lines it blocks."""
+        k, value = self.k, self.value
+        free = cand & ~(me | opp) & self.full
+        moves = []
+        while free:
+            low = free & -free
+            move = low.bit_length() - 1
+            free ^= low
+            gain, wins = 0, False
+            for w in self.windows_at[move]:
+                a = (me & w).bit_count()
+                b = (opp & w).bit_count()
+                if not b:
+                    if a + 1 == k:
+                        wins = True
+                        break
+                    gain += value[a + 1] - value[a]
+                elif not a:
+                    gain += value[b]
+            moves.append((WIN_SCORE if wins else gain, move, wins))
+        moves.sort(reverse=True)
+        return moves
+
+    def _negamax(self, me, opp, depth, alpha, beta, h, evaluation, cand, color, ply, deadline):
+        # Search state lives in arguments (only the TT is shared), so one
+        # cached MNKGame can serve concurrent sessions.
+        if time.perf_counter() > deadline:
+            raise SearchTimeout
+
+        alpha0 = alpha
+        entry = self.tt.get(h)
+        tt_move = None
+        if entry is not None:
+            e_depth, e_flag, e_score, tt_move = entry
+            if e_depth >= depth:
+                if e_flag == EXACT:
+                    return e_score, tt_move
+                if e_flag == LOWER:
+                    alpha = max(alpha, e_score)
+                elif e_flag == UPPER:
+                    beta = min(beta, e_score)
+                if alpha >= beta:
+                    return e_score, tt_move
+
+        moves = self._candidates(me, opp, cand)
+        if not moves:
+            return 0, None  # board full: draw
+        if moves[0][2]:
+            return WIN_SCORE - ply, moves[0][1]
+        moves = moves[:BEAM_WIDTH]
+        if tt_move is not None:
+            for i, m in enumerate(moves):
+                if m[1] == tt_move:
+                    moves.insert(0, moves.pop(i))
+                    break
+
+        best_score, best_move = -WIN_SCORE - 1, None
+        for gain, move, _ in moves:
+            if depth == 1:
+                score = evaluation + gain  # leaf: static eval after the move
+            else:
+                bit = 1 << move
+                score, _ = self._negamax(
+                    opp, me | bit, depth - 1, -beta, -alpha,
+                    h ^ self.zobrist[move][color], -(evaluation + gain),
+                    cand | self.near[move], 1 - color, ply + 1, deadline,
+                )
+                score = -score
+            if score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        flag = UPPER if best_score <= alpha0 else LOWER if best_score >= beta else EXACT
+        self.tt[h] = (depth, flag, best_score, best_move)
+        return best_score, best_move
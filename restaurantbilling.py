@@ -1,15 +1,24 @@
 # restaurant_billing_multi_hub.py
 import streamlit as st
 import pandas as pd
+import numpy as np
+import hashlib
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
 from io import BytesIO, StringIO
 from datetime import datetime
 
+from exchange_rates import get_rate_table
+from kitchen_queue import KitchenQueueFull, new_submission_id, submit_order
+from menu_catalog import MENU_CATALOG_PATH, get_menu_catalog
+
 # Try to import reportlab for PDF export
 try:
     from reportlab.lib.pagesizes import A4
     from reportlab.lib import colors
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from PIL import Image as PILImage  # bundled dependency of reportlab
     REPORTLAB_AVAILABLE = True
 except Exception:
     REPORTLAB_AVAILABLE = False
@@ -20,6 +29,27 @@ except Exception:
 def safe_key(s: str) -> str:
     return "".join(ch if ch.isalnum() else "_" for ch in s)
 
+# -------------------------
+# Logo: decode + scale once per distinct upload
+# -------------------------
+LOGO_DRAW_SIZE = (90, 45)  # points on the PDF page
+LOGO_PIXEL_SCALE = 2       # rasterize at 2x so the logo stays crisp in print
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def prepare_logo(digest: str, _raw: bytes) -> bytes:
+    """Return the uploaded logo as a PNG pre-scaled to the invoice draw size.
+
+    Cached by the SHA-256 `digest` of the upload, so each logo is decoded and
+    resized once and every invoice embeds the same small image bytes.
+    """
+    w, h = LOGO_DRAW_SIZE
+    with PILImage.open(BytesIO(_raw)) as im:
+        im = im.convert("RGBA") if im.mode in ("RGBA", "LA", "P") else im.convert("RGB")
+        im = im.resize((w * LOGO_PIXEL_SCALE, h * LOGO_PIXEL_SCALE), PILImage.LANCZOS)
+        out = BytesIO()
+        im.save(out, format="PNG", optimize=True)
+    return out.getvalue()
+
 # -------------------------
 # Page config + CSS
 # -------------------------
@@ -65,72 +95,203 @@ st.markdown(
 )
 
 # -------------------------
-# 5 hubs, total 20 items (4 items per hub)
+# Menu catalog (menu_catalog.py): shared across sessions, hot-reloaded on edit
 # -------------------------
-restaurants = {
-    "Burger Hub": {
-        "banner_color": "#FFF3E0",
-        "menu": {
-            "Classic Burger": {"price": 130.0, "color": "#FFE0B2"},
-            "Cheese Burger": {"price": 160.0, "color": "#FFDAB9"},
-            "Veggie Burger": {"price": 120.0, "color": "#FFEFD5"},
-            "Fries Large": {"price": 90.0, "color": "#FFF7C2"},
-        },
-    },
-    "Pizzeria Corner": {
-        "banner_color": "#FFF8E1",
-        "menu": {
-            "Margherita": {"price": 220.0, "color": "#FFF1C9"},
-            "Pepperoni": {"price": 260.0, "color": "#FFE7BF"},
-            "Four Cheese": {"price": 300.0, "color": "#FFEFD6"},
-            "Garlic Bread": {"price": 95.0, "color": "#F0F8E2"},
-        },
-    },
-    "Pasta House": {
-        "banner_color": "#F0FFF4",
-        "menu": {
-            "Alfredo Pasta": {"price": 210.0, "color": "#E6FFFA"},
-            "Arrabiata": {"price": 200.0, "color": "#F0FFF0"},
-            "Pesto Pasta": {"price": 230.0, "color": "#E9FFF6"},
-            "Garlic Prawns Pasta": {"price": 320.0, "color": "#FFF0F5"},
-        },
-    },
-    "Cafe Delight": {
-        "banner_color": "#F3E8FF",
-        "menu": {
-            "Cappuccino": {"price": 120.0, "color": "#F3E8FF"},
-            "Latte": {"price": 130.0, "color": "#F6EFFE"},
-            "Blueberry Muffin": {"price": 85.0, "color": "#FFF7F0"},
-            "Chocolate Brownie": {"price": 95.0, "color": "#FFF0F0"},
-        },
-    },
-    "Asian Wok": {
-        "banner_color": "#E8F7FF",
-        "menu": {
-            "Chicken Fried Rice": {"price": 160.0, "color": "#E8F7FF"},
-            "Veg Noodles": {"price": 140.0, "color": "#F0FBF6"},
-            "Manchurian": {"price": 170.0, "color": "#FFF7E6"},
-            "Schezwan Noodles": {"price": 180.0, "color": "#FFF2F0"},
-        },
-    },
-}
+MENU_PAGE_SIZE = 12  # cards rendered per page (3 rows x 4 columns)
+
+try:
+    catalog = get_menu_catalog()
+except (OSError, ValueError, KeyError) as e:
+    st.error(f"Could not load the menu catalog from {MENU_CATALOG_PATH}.")
+    st.exception(e)
+    st.stop()
+
+# -------------------------
+# Bill engine: exact integer minor units (paise / cents), vectorized with NumPy
+# -------------------------
+MINOR_DIGITS = 2                    # decimal places of the minor unit for most currencies
+CURRENCY_MINOR_DIGITS = {"JPY": 0}  # currencies with a different exponent (yen has no subunit)
+
+def minor_digits(currency: str) -> int:
+    return CURRENCY_MINOR_DIGITS.get(currency, MINOR_DIGITS)
+
+def to_minor(amount, digits: int = MINOR_DIGITS) -> int:
+    return int((Decimal(str(amount)) * 10 ** digits).to_integral_value(ROUND_HALF_UP))
+
+def fmt_minor(value: int, digits: int = MINOR_DIGITS) -> str:
+    if digits == 0:
+        return str(value)
+    whole, frac = divmod(value, 10 ** digits)
+    return f"{whole}.{frac:0{digits}d}"
+
+def pct_to_bp(pct: float) -> int:
+    return to_minor(pct, 2)  # 1% == 100 basis points
+
+def fmt_bp(rate_bp: int) -> str:
+    whole, frac = divmod(rate_bp, 100)
+    return str(whole) if frac == 0 else f"{whole}.{frac:02d}".rstrip("0")
+
+def apply_bp(amount_minor: np.ndarray, rate_bp: np.ndarray) -> np.ndarray:
+    # amount * rate / 10_000 rounded half-up, without leaving integer arithmetic
+    return (amount_minor * rate_bp + 5_000) // 10_000
+
+@dataclass(frozen=True)
+class Bill:
+    """Computed bill shared by the on-screen table, CSV and PDF exports."""
+    items: tuple
+    quantities: np.ndarray
+    unit_minor: np.ndarray
+    discount_minor: np.ndarray
+    line_minor: np.ndarray
+    subtotal_minor: int
+    tax_minor: int
+    tip_minor: int
+    total_minor: int
+    tax_label: str
+    digits: int = MINOR_DIGITS  # minor-unit exponent of the bill's currency
+
+    @property
+    def has_discounts(self) -> bool:
+        return bool(self.discount_minor.any())
+
+    def columns(self, suffix: str = "") -> list:
+        cols = ["Item", "Quantity", f"Unit Price{suffix}"]
+        if self.has_discounts:
+            cols.append(f"Discount{suffix}")
+        return cols + [f"Total{suffix}"]
+
+    def rows(self) -> list:
+        """Line items with amounts already formatted to the currency's decimals."""
+        amounts = [self.unit_minor, self.discount_minor, self.line_minor] if self.has_discounts else [self.unit_minor, self.line_minor]
+        formatted = [[fmt_minor(v, self.digits) for v in arr.tolist()] for arr in amounts]
+        return [[item, qty, *vals] for item, qty, *vals in zip(self.items, self.quantities.tolist(), *formatted)]
+
+    def summary(self) -> list:
+        return [
+            ("Subtotal", fmt_minor(self.subtotal_minor, self.digits)),
+            (self.tax_label, fmt_minor(self.tax_minor, self.digits)),
+            ("Tip", fmt_minor(self.tip_minor, self.digits)),
+            ("Total", fmt_minor(self.total_minor, self.digits)),
+        ]
+
+def compute_bill(lines: list, tax_rate_bp: dict, tip, digits: int = MINOR_DIGITS) -> Bill:
+    """Build a Bill from (item, unit_minor, qty, tax_class, discount_pct) lines.
+
+    `tax_rate_bp` maps tax class -> rate in basis points; `digits` is the
+    minor-unit exponent of the currency the unit prices are in. Per-line discount and
+    tax are rounded half-up to the minor unit, so printed lines always add up
+    to the printed totals.
+    """
+    items, unit, qty, tax_classes, discount_pct = zip(*lines)
+    unit = np.array(unit, dtype=np.int64)
+    qty = np.array(qty, dtype=np.int64)
+    discount_bp = np.array([pct_to_bp(d) for d in discount_pct], dtype=np.int64)
+    rate_bp = np.array([tax_rate_bp[c] for c in tax_classes], dtype=np.int64)
+
+    gross = unit * qty
+    discount = apply_bp(gross, discount_bp)
+    line = gross - discount
+    line_tax = apply_bp(line, rate_bp)
+
+    subtotal = int(line.sum())
+    tax = int(line_tax.sum())
+    tip_minor = to_minor(tip, digits)
+
+    distinct_rates = set(rate_bp.tolist())
+    tax_label = f"Tax ({fmt_bp(distinct_rates.pop())}%)" if len(distinct_rates) == 1 else "Tax"
+
+    return Bill(
+        items=items,
+        quantities=qty,
+        unit_minor=unit,
+        discount_minor=discount,
+        line_minor=line,
+        subtotal_minor=subtotal,
+        tax_minor=tax,
+        tip_minor=tip_minor,
+        total_minor=subtotal + tax + tip_minor,
+        tax_label=tax_label,
+        digits=digits,
+    )
+
+# -------------------------
+# Currency conversion: menu prices converted once per catalog + rate version
+# -------------------------
+CURRENCY_SYMBOLS = {"INR": "₹", "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥"}
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def convert_menu_prices(catalog_version: str, rates_version: str, currency: str, _catalog: dict, _rates) -> dict:
+    """(hub, item) -> unit price in minor units of `currency`.
+
+    Only the version strings and currency are hashed, so the whole menu is
+    converted once per rate/catalog change and then shared by every session.
+    """
+    rate = _rates.rate(_catalog["currency"], currency)
+    return {
+        key: int((Decimal(str(price)) * rate * 10 ** minor_digits(currency)).to_integral_value(ROUND_HALF_UP))
+        for key, price in _catalog["prices"].items()
+    }
+
+try:
+    rate_table = get_rate_table()
+    currency_codes = [c for c in CURRENCY_SYMBOLS if c in rate_table.rates and catalog["currency"] in rate_table.rates]
+except (OSError, ValueError, KeyError):
+    rate_table = None
+    currency_codes = []
+if not currency_codes:
+    st.warning("Exchange rates are unavailable — prices are shown in the menu's own currency only.")
+    currency_codes = [catalog["currency"]]
+
+# Quantities live here rather than only in widget state, so items on menu
+# pages that are not currently rendered keep their quantity.
+if "order_qty" not in st.session_state:
+    st.session_state.order_qty = {}
+
+def sync_qty(hub: str, item_name: str, widget_key: str):
+    qty = int(st.session_state[widget_key])
+    if qty > 0:
+        st.session_state.order_qty[(hub, item_name)] = qty
+    else:
+        st.session_state.order_qty.pop((hub, item_name), None)
 
 # -------------------------
 # Top controls: choose hub + customer + order + currency + optional logo upload
 # -------------------------
 col1, col2, col3 = st.columns([2, 2, 1])
 with col1:
-    hub_choice = st.selectbox("Choose Hub / Restaurant", list(restaurants.keys()))
+    hub_choice = st.selectbox("Choose Hub / Restaurant", catalog["hubs"])
 with col2:
     customer_name = st.text_input("Customer name", "")
 with col3:
     order_no = st.text_input("Table / Order #", "")
 
-currency_choice = st.selectbox("Currency", ["₹ - INR", "$ - USD", "€ - EUR"], index=0)
-currency_symbol = currency_choice.split()[0]
+currency_code = st.selectbox(
+    "Currency",
+    currency_codes,
+    index=currency_codes.index(catalog["currency"]) if catalog["currency"] in currency_codes else 0,
+    format_func=lambda c: f"{CURRENCY_SYMBOLS.get(c, c)} - {c}",
+)
+currency_symbol = CURRENCY_SYMBOLS.get(currency_code, currency_code)
+digits = minor_digits(currency_code)
+if rate_table is not None:
+    unit_prices = convert_menu_prices(catalog["version"], rate_table.version, currency_code, catalog, rate_table)
+    if currency_code != catalog["currency"]:
+        st.caption(f"1 {catalog['currency']} = {rate_table.rate(catalog['currency'], currency_code):.4f} {currency_code} · rates as of {rate_table.as_of or 'n/a'}")
+else:
+    unit_prices = {key: to_minor(price, digits) for key, price in catalog["prices"].items()}
 
 logo_file = st.file_uploader("Upload restaurant logo (optional)", type=["png", "jpg", "jpeg"])
 
+# getvalue() does not depend on the buffer position, unlike read(), so the
+# logo survives reruns instead of vanishing once the upload hits EOF.
+logo_png = None
+if logo_file is not None and REPORTLAB_AVAILABLE:
+    logo_raw = logo_file.getvalue()
+    try:
+        logo_png = prepare_logo(hashlib.sha256(logo_raw).hexdigest(), logo_raw)
+    except Exception:
+        st.warning("Could not read the uploaded logo — the invoice will be generated without it.")
+
 # invoice metadata
 now = datetime.now()
 invoice_no = f"INV{now.strftime('%Y%m%d%H%M%S')}"
@@ -138,7 +299,7 @@ timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
 wish_message = "Thank you for dining with us — we hope to see you again!"
 
 # show banner
-banner_color = restaurants[hub_choice]["banner_color"]
+banner_color = catalog["banner_colors"][hub_choice]
 st.markdown(
     f"<div style='background:{banner_color};padding:8px;border-radius:8px'><h3 style='margin:4px 0'>{hub_choice}</h3></div>",
     unsafe_allow_html=True,
@@ -150,41 +311,56 @@ st.markdown(
 )
 
 # -------------------------
-# Menu display: colorful scrollable cards (4 columns)
+# Menu display: colorful cards (4 columns), one page of items at a time
 # -------------------------
-menu = restaurants[hub_choice]["menu"]
-selected_items = {}
+items = catalog["items"][hub_choice]
 
 st.markdown("### 📋 Menu")
+
+n_pages = max(1, -(-len(items) // MENU_PAGE_SIZE))
+page = 1
+if n_pages > 1:
+    page = st.number_input(f"Menu page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1,
+                           key=safe_key(f"{hub_choice}_menu_page"))
+page_items = items[(page - 1) * MENU_PAGE_SIZE : page * MENU_PAGE_SIZE]
+
 st.markdown("<div class='scroll-container'>", unsafe_allow_html=True)
 
 cols_per_row = 4
-items = list(menu.items())
-for i in range(0, len(items), cols_per_row):
-    row = items[i : i + cols_per_row]
+for i in range(0, len(page_items), cols_per_row):
+    row = page_items[i : i + cols_per_row]
     cols = st.columns(cols_per_row)
-    for col, (item_name, info) in zip(cols, row):
+    for col, (item_name, _, color) in zip(cols, row):
         with col:
             st.markdown(
-                f"<div class='menu-card' style='background:{info['color']}; min-height:88px; padding-top:10px;'>"
+                f"<div class='menu-card' style='background:{color}; min-height:88px; padding-top:10px;'>"
                 f"<div style='font-size:14px'>{item_name}</div>"
-                f"<div style='font-size:13px; opacity:0.9'>{currency_symbol}{info['price']:.2f}</div>"
+                f"<div style='font-size:13px; opacity:0.9'>{currency_symbol}{fmt_minor(unit_prices[(hub_choice, item_name)], digits)}</div>"
                 f"</div>",
                 unsafe_allow_html=True,
             )
-            qty = st.number_input(
+            widget_key = safe_key(f"{hub_choice}_{item_name}")
+            st.number_input(
                 label="Qty",
                 min_value=0,
                 max_value=50,
+                value=st.session_state.order_qty.get((hub_choice, item_name), 0),
                 step=1,
-                key=safe_key(f"{hub_choice}_{item_name}"),
+                key=widget_key,
                 format="%d",
+                on_change=sync_qty,
+                args=(hub_choice, item_name, widget_key),
             )
-            if qty > 0:
-                selected_items[item_name] = {"price": float(info["price"]), "quantity": int(qty)}
 
 st.markdown("</div>", unsafe_allow_html=True)
 
+# Selected items for this hub, priced through the catalog index
+selected_items = {
+    item_name: {"unit_minor": unit_prices[(hub, item_name)], "quantity": qty, "meta": catalog["item_meta"][(hub, item_name)]}
+    for (hub, item_name), qty in st.session_state.order_qty.items()
+    if hub == hub_choice and (hub, item_name) in catalog["prices"]
+}
+
 # -------------------------
 # Bill Summary (if any item selected)
 # -------------------------
@@ -192,40 +368,36 @@ if not selected_items:
     st.info("Add quantities for items above to build the order. Use the Qty input below each card.")
     st.stop()
 
-# Build bill rows and compute subtotal
-bill_rows = []
-subtotal = 0.0
-for itm, det in selected_items.items():
-    unit = float(det["price"])
-    qty = int(det["quantity"])
-    line_total = unit * qty
-    line_total = round(line_total, 2)  # safe rounding
-    subtotal += line_total
-    bill_rows.append([itm, qty, unit, line_total])
-
-subtotal = round(subtotal, 2)
-
 # Tax and (optional) tip
 tax_rate = st.slider("Tax rate (%)", min_value=0, max_value=30, value=5, step=1)
-tip = st.number_input("Tip (optional)", min_value=0.0, value=0.0, step=1.0, format="%.2f")
-tax = round(subtotal * (tax_rate / 100.0), 2)
-tip = round(float(tip), 2)
-total = round(subtotal + tax + tip, 2)
+tip = st.number_input("Tip (optional)", min_value=0.0, value=0.0, step=1.0, format=f"%.{digits}f")
+
+tax_rate_bp = {cls: pct_to_bp(pct) for cls, pct in catalog["tax_classes"].items()}
+tax_rate_bp["standard"] = pct_to_bp(tax_rate)
+try:
+    bill = compute_bill(
+        [
+            (itm, det["unit_minor"], det["quantity"], *det["meta"])
+            for itm, det in selected_items.items()
+        ],
+        tax_rate_bp,
+        tip,
+        digits,
+    )
+except KeyError as e:
+    st.error(f"Menu catalog refers to an unknown tax class: {e}")
+    st.stop()
+
+summary = bill.summary()
 
-# Present as DataFrame
-df = pd.DataFrame(bill_rows, columns=["Item", "Quantity", f"Unit Price ({currency_symbol})", f"Total ({currency_symbol})"])
-# formatting numbers (so df shows nicely)
-df[f"Unit Price ({currency_symbol})"] = df[f"Unit Price ({currency_symbol})"].map(lambda x: f"{x:.2f}")
-df[f"Total ({currency_symbol})"] = df[f"Total ({currency_symbol})"].map(lambda x: f"{x:.2f}")
+# Present as DataFrame (amounts are already formatted by the bill engine)
+df = pd.DataFrame(bill.rows(), columns=bill.columns(f" ({currency_symbol})"))
 
 st.subheader("🧾 Bill Summary")
 st.table(df)
 
-c1, c2, c3, c4 = st.columns(4)
-c1.metric("Subtotal", f"{currency_symbol}{subtotal:.2f}")
-c2.metric(f"Tax ({tax_rate}%)", f"{currency_symbol}{tax:.2f}")
-c3.metric("Tip", f"{currency_symbol}{tip:.2f}")
-c4.metric("Total", f"{currency_symbol}{total:.2f}")
+for col, (label, amount) in zip(st.columns(4), summary):
+    col.metric(label, f"{currency_symbol}{amount}")
 
 # -------------------------
 # CSV download (metadata + items + totals + wish)
@@ -238,13 +410,12 @@ def build_csv_bytes():
     sio.write(f"Customer:,{customer_name or '-'}\n")
     sio.write(f"Order/Table:,{order_no or '-'}\n\n")
     # items
-    export_df = pd.DataFrame(bill_rows, columns=["Item", "Quantity", "Unit Price", "Total"])
+    export_df = pd.DataFrame(bill.rows(), columns=bill.columns())
     export_df.to_csv(sio, index=False)
     sio.write("\n")
-    sio.write(f"Subtotal:,{subtotal:.2f}\n")
-    sio.write(f"Tax ({tax_rate}%):,{tax:.2f}\n")
-    sio.write(f"Tip:,{tip:.2f}\n")
-    sio.write(f"Total:,{total:.2f}\n\n")
+    for label, amount in summary:
+        sio.write(f"{label}:,{amount}\n")
+    sio.write("\n")
     sio.write(f"Message:,{wish_message}\n")
     return sio.getvalue().encode("utf-8")
 
@@ -268,16 +439,10 @@ def generate_pdf_invoice():
 
     story = []
 
-    # Optional logo (if uploaded)
-    if logo_file is not None:
-        try:
-            logo_bytes = BytesIO(logo_file.read())
-            img = Image(logo_bytes)
-            img.drawWidth = 90
-            img.drawHeight = 45
-            story.append(img)
-        except Exception:
-            pass
+    # Optional logo (if uploaded) — already normalized and scaled by prepare_logo
+    if logo_png is not None:
+        img = Image(BytesIO(logo_png), width=LOGO_DRAW_SIZE[0], height=LOGO_DRAW_SIZE[1])
+        story.append(img)
 
     story.append(Paragraph(f"<b>{hub_choice} — Invoice</b>", title_style))
     story.append(Spacer(1, 6))
@@ -288,12 +453,14 @@ def generate_pdf_invoice():
     story.append(Spacer(1, 12))
 
     # Items table
-    table_data = [["Item", "Qty", f"Unit ({currency_symbol})", f"Total ({currency_symbol})"]]
-    for row in bill_rows:
-        item, qty, unit, line_total = row
-        table_data.append([item, str(qty), f"{unit:.2f}", f"{line_total:.2f}"])
-
-    table_col_widths = [260, 50, 90, 90]
+    header = ["Item", "Qty", f"Unit ({currency_symbol})"]
+    if bill.has_discounts:
+        header.append(f"Discount ({currency_symbol})")
+    table_data = [header + [f"Total ({currency_symbol})"]]
+    for item, qty, *amounts in bill.rows():
+        table_data.append([item, str(qty), *amounts])
+
+    table_col_widths = [200, 50, 80, 80, 80] if bill.has_discounts else [260, 50, 90, 90]
     t = Table(table_data, colWidths=table_col_widths, hAlign="LEFT")
     t.setStyle(TableStyle([
         ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#f3f4f6")),
@@ -306,12 +473,7 @@ def generate_pdf_invoice():
     story.append(Spacer(1, 12))
 
     # totals
-    summary_data = [
-        ["Subtotal", f"{currency_symbol}{subtotal:.2f}"],
-        [f"Tax ({tax_rate}%)", f"{currency_symbol}{tax:.2f}"],
-        ["Tip", f"{currency_symbol}{tip:.2f}"],
-        ["Total", f"{currency_symbol}{total:.2f}"],
-    ]
+    summary_data = [[label, f"{currency_symbol}{amount}"] for label, amount in summary]
     summary_tbl = Table(summary_data, colWidths=[320, 170], hAlign="RIGHT")
     summary_tbl.setStyle(TableStyle([
         ("ALIGN", (1,0), (-1,-1), "RIGHT"),
@@ -344,6 +506,36 @@ if REPORTLAB_AVAILABLE:
 else:
     st.warning("PDF export is disabled because 'reportlab' is not installed. Run: pip install reportlab")
 
+# -------------------------
+# Send to kitchen: one queue insert, the kitchen displays pick it up from there
+# -------------------------
+kitchen_order = {
+    "customer": customer_name or "-",
+    "order_no": order_no or "-",
+    "items": [[item, qty] for item, qty in zip(bill.items, bill.quantities.tolist())],
+    "total": f"{currency_symbol}{fmt_minor(bill.total_minor, digits)}",
+}
+# One submission id per bill sent to the kitchen: a retry after an error
+# reuses it (the queue ignores a duplicate), and a new one is minted once the
+# order is queued, so a repeat order with the same items is sent as new.
+if "kitchen_submission_id" not in st.session_state:
+    st.session_state.kitchen_submission_id = new_submission_id()
+
+if st.button("👨‍🍳 Send order to kitchen"):
+    try:
+        queued = submit_order(hub_choice, invoice_no, kitchen_order,
+                              submission_id=st.session_state.kitchen_submission_id)
+        st.session_state.kitchen_submission_id = new_submission_id()
+        if queued:
+            st.toast(f"Order {invoice_no} sent to {hub_choice} kitchen")
+        else:
+            st.info("This order was already sent to the kitchen.")
+    except KitchenQueueFull:
+        st.warning(f"{hub_choice} kitchen is at capacity — please wait a moment and send again.")
+    except Exception as e:
+        st.error("Could not reach the kitchen queue.")
+        st.exception(e)
+
 # -------------------------
 # End
 # -------------------------
@@ -1,9 +1,14 @@
 # rps_app.py
 import streamlit as st
-import random
-import pandas as pd
+import sqlite3
 from datetime import datetime
-import io
+from functools import partial
+
+from rps_engine import COMPUTER_WINS, DEFAULT_VARIANT, TIE, USER_WINS, VARIANTS
+from rps_history import RoundHistory
+from rps_simulator import USER_STRATEGIES, simulate_matches, win_odds_by_score
+from rps_stats import clean_player_name, leaderboard, record_round
+from rps_strategies import DEFAULT_STRATEGY, STRATEGIES, Opponent
 
 st.set_page_config(
     page_title="Rock · Paper · Scissors 🎮",
@@ -13,62 +18,116 @@ st.set_page_config(
 )
 
 ### ---------- helpers ----------
-CHOICES = ["Rock", "Paper", "Scissors"]
-EMOJI = {"Rock": "✊", "Paper": "✋", "Scissors": "✌️"}
-
-def decide_winner(user, comp):
-    if user == comp:
-        return "Tie"
-    wins = {
-        ("Rock", "Scissors"),
-        ("Paper", "Rock"),
-        ("Scissors", "Paper")
-    }
-    return "User" if (user, comp) in wins else "Computer"
+# History limit option -> ring-buffer cap (None keeps every round)
+HISTORY_LIMITS = {"Unlimited": None, "Last 100 rounds": 100, "Last 1,000 rounds": 1000, "Last 10,000 rounds": 10000}
+HISTORY_PAGE_SIZE = 50  # rounds per history page; only this page is built on a rerun
+ODDS_TABLE_MATCHES = 10_000  # simulated matches per cell of the per-strategy odds table
 
 def ensure_session():
+    if "variant" not in st.session_state:
+        st.session_state.variant = DEFAULT_VARIANT
     if "user_score" not in st.session_state:
         st.session_state.user_score = 0
     if "comp_score" not in st.session_state:
         st.session_state.comp_score = 0
     if "rounds" not in st.session_state:
         st.session_state.rounds = 0
+    if "history_limit" not in st.session_state:
+        st.session_state.history_limit = "Unlimited"
     if "history" not in st.session_state:
-        # list of dicts: round, time, user, comp, result
-        st.session_state.history = []
+        # columnar rounds: round, time, user, comp, result
+        st.session_state.history = RoundHistory(HISTORY_LIMITS[st.session_state.history_limit])
+    if "opponent" not in st.session_state:
+        st.session_state.opponent = Opponent(VARIANTS[st.session_state.variant].n)
+    if "strategy" not in st.session_state:
+        st.session_state.strategy = DEFAULT_STRATEGY
+    if "player_name" not in st.session_state:
+        st.session_state.player_name = ""
 
-def add_round(user_choice, comp_choice, winner):
+def play_round(user):
+    """Move button callback: one round for the user's move index."""
+    variant = VARIANTS[st.session_state.variant]
+    comp = st.session_state.opponent.choose(st.session_state.strategy)
+    result = variant.decide(user, comp)
     st.session_state.rounds += 1
-    if winner == "User":
+    st.session_state.opponent.observe(user)
+    if result == USER_WINS:
         st.session_state.user_score += 1
-    elif winner == "Computer":
+    elif result == COMPUTER_WINS:
         st.session_state.comp_score += 1
-    st.session_state.history.append({
-        "Round": st.session_state.rounds,
-        "Time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "User": f"{user_choice} {EMOJI[user_choice]}",
-        "Computer": f"{comp_choice} {EMOJI[comp_choice]}",
-        "Result": winner
-    })
+    st.session_state.history.append(st.session_state.rounds, user, comp, result)
+    st.session_state.last_action = (user, comp, result)
+
+    player = clean_player_name(st.session_state.player_name)
+    st.session_state.stats_error = None
+    if player:
+        try:
+            record_round(player, variant.name, st.session_state.strategy, user, comp, result)
+        except sqlite3.Error as e:
+            st.session_state.stats_error = f"Couldn't save this round to the leaderboard: {e}"
 
 def reset_game():
     st.session_state.user_score = 0
     st.session_state.comp_score = 0
     st.session_state.rounds = 0
-    st.session_state.history = []
+    st.session_state.history = RoundHistory(HISTORY_LIMITS[st.session_state.history_limit])
+    st.session_state.opponent = Opponent(VARIANTS[st.session_state.variant].n)
+    st.session_state.pop("last_action", None)
+
+def apply_history_limit():
+    st.session_state.history.set_cap(HISTORY_LIMITS[st.session_state.history_limit])
+
+RESULT_STYLES = {"User": "color: green; font-weight:600", "Computer": "color: red; font-weight:600"}
+TIE_STYLE = "color: gray; font-weight:600"
+
+def color_results(results):
+    return results.map(RESULT_STYLES).fillna(TIE_STYLE)
+
+def styled_history_page(page):
+    """One page of the history, newest round first (page 1 is the latest).
+
+    Only HISTORY_PAGE_SIZE rows are built and styled, however long the
+    history is.
+    """
+    history = st.session_state.history
+    stop = len(history) - (page - 1) * HISTORY_PAGE_SIZE
+    df = history.to_frame(VARIANTS[st.session_state.variant].labels, stop - HISTORY_PAGE_SIZE, stop)
+    df = df.iloc[::-1].reset_index(drop=True)
+    return (df.style.set_properties(subset=["User", "Computer"], **{"font-weight": "600"})
+                    .apply(color_results, subset=["Result"]))
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def odds_by_score(variant_name, user_strategy, comp_strategy, best_of):
+    """Monte-Carlo chance that the user wins a best-of-N match, from every
+    score still in play; one simulation serves the whole match."""
+    return win_odds_by_score(VARIANTS[variant_name], user_strategy, comp_strategy, best_of)
 
-def history_df():
-    if st.session_state.history:
-        return pd.DataFrame(st.session_state.history)
-    return pd.DataFrame(columns=["Round","Time","User","Computer","Result"])
+def match_odds_from(variant_name, user_strategy, comp_strategy, best_of, user_score, comp_score):
+    needed = best_of // 2 + 1
+    if user_score >= needed:
+        return 1.0
+    if comp_score >= needed:
+        return 0.0
+    return float(odds_by_score(variant_name, user_strategy, comp_strategy, best_of)[user_score, comp_score])
 
-def csv_bytes_from_df(df: pd.DataFrame) -> bytes:
-    buf = io.StringIO()
-    df.to_csv(buf, index=False)
-    return buf.getvalue().encode("utf-8")
+@st.cache_data(max_entries=256, show_spinner=False)
+def match_odds(variant_name, user_strategy, comp_strategy, best_of):
+    """Monte-Carlo chance that the user wins a best-of-N match from 0:0 (smaller sample)."""
+    return simulate_matches(VARIANTS[variant_name], user_strategy, comp_strategy, best_of,
+                            matches=ODDS_TABLE_MATCHES)["user_win_prob"]
 
 ### ---------- UI ----------
 ensure_session()
+variant = VARIANTS[st.session_state.variant]
+
+st.sidebar.text_input("Player name", key="player_name", max_chars=30,
+                      help="Rounds played under a name are saved to the all-time leaderboard.")
+st.sidebar.selectbox("Game variant", list(VARIANTS), key="variant", on_change=reset_game,
+                     help="Switching variants starts a new game.")
+st.sidebar.selectbox("History limit", list(HISTORY_LIMITS), key="history_limit", on_change=apply_history_limit,
+                     help="Keep only the most recent rounds in the history table and CSV.")
+st.sidebar.selectbox("Computer strategy", list(STRATEGIES), key="strategy",
+                     help="Adaptive strategies learn your habits from the rounds played so far.")
 
 st.markdown(
     """
@@ -87,38 +146,22 @@ col1, col2 = st.columns([1, 1])
 with col1:
     st.subheader("Make your move")
     # Big buttons for choices
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        if st.button(f"Rock {EMOJI['Rock']}", key="b_rock"):
-            user_choice = "Rock"
-            comp_choice = random.choice(CHOICES)
-            winner = decide_winner(user_choice, comp_choice)
-            add_round(user_choice, comp_choice, winner)
-            st.session_state.last_action = (user_choice, comp_choice, winner)
-    with c2:
-        if st.button(f"Paper {EMOJI['Paper']}", key="b_paper"):
-            user_choice = "Paper"
-            comp_choice = random.choice(CHOICES)
-            winner = decide_winner(user_choice, comp_choice)
-            add_round(user_choice, comp_choice, winner)
-            st.session_state.last_action = (user_choice, comp_choice, winner)
-    with c3:
-        if st.button(f"Scissors {EMOJI['Scissors']}", key="b_scissors"):
-            user_choice = "Scissors"
-            comp_choice = random.choice(CHOICES)
-            winner = decide_winner(user_choice, comp_choice)
-            add_round(user_choice, comp_choice, winner)
-            st.session_state.last_action = (user_choice, comp_choice, winner)
+    for i, (col, label) in enumerate(zip(st.columns(variant.n), variant.labels)):
+        with col:
+            st.button(label, key=f"b_{variant.moves[i].lower()}", on_click=play_round, args=(i,))
 
     st.write("")
     if "last_action" in st.session_state:
         u, c, w = st.session_state.last_action
-        if w == "Tie":
-            st.info(f"Round {st.session_state.rounds}: It's a tie — {EMOJI[u]} vs {EMOJI[c]}")
-        elif w == "User":
-            st.success(f"Round {st.session_state.rounds}: You win! {EMOJI[u]} beats {EMOJI[c]}")
+        u, c = variant.emoji[variant.moves[u]], variant.emoji[variant.moves[c]]
+        if w == TIE:
+            st.info(f"Round {st.session_state.rounds}: It's a tie — {u} vs {c}")
+        elif w == USER_WINS:
+            st.success(f"Round {st.session_state.rounds}: You win! {u} beats {c}")
         else:
-            st.error(f"Round {st.session_state.rounds}: Computer wins — {EMOJI[c]} beats {EMOJI[u]}")
+            st.error(f"Round {st.session_state.rounds}: Computer wins — {c} beats {u}")
+    if st.session_state.get("stats_error"):
+        st.warning(st.session_state.stats_error)
 
 with col2:
     st.subheader("Scoreboard")
@@ -145,38 +188,64 @@ with col2:
         elif st.session_state.comp_score >= needed:
             st.warning(f"Computer has won the {target}.")
 
+        # Simulated odds for a user playing the chosen style
+        sim_style = st.sidebar.selectbox("Your style (for match odds)", list(USER_STRATEGIES), key="sim_strategy")
+        odds = match_odds_from(variant.name, sim_style, st.session_state.strategy, best_n,
+                               st.session_state.user_score, st.session_state.comp_score)
+        st.metric(f"Chance to win the {target} from here", f"{odds:.0%}",
+                  help=f"Monte-Carlo estimate: a '{sim_style}' player vs the {st.session_state.strategy} computer.")
+        # simulated only while switched on (12 simulations the first time)
+        if st.toggle("Show match odds by strategy", key="show_odds_table"):
+            st.dataframe(
+                [{"Computer strategy": comp} | {f"Best of {n}": f"{match_odds(variant.name, sim_style, comp, n):.0%}"
+                                                for n in (3, 5, 7)}
+                 for comp in STRATEGIES],
+                use_container_width=True, hide_index=True,
+            )
+
 st.write("---")
 
 # History & download
 st.subheader("Round History")
-df_hist = history_df()
-if df_hist.empty:
-    st.info("No rounds yet — pick Rock, Paper, or Scissors to start playing!")
+history = st.session_state.history
+if not len(history):
+    st.info(f"No rounds yet — pick {', '.join(variant.moves[:-1])}, or {variant.moves[-1]} to start playing!")
 else:
+    pages = -(-len(history) // HISTORY_PAGE_SIZE)
+    page = 1
+    if pages > 1:
+        # a reset or a smaller history limit can leave the saved page past the end
+        if st.session_state.get("history_page", 1) > pages:
+            st.session_state.history_page = pages
+        page = st.number_input(f"History page (of {pages}, newest first)", min_value=1, max_value=pages,
+                               step=1, key="history_page")
     # color-coding results inline using dataframe style for display
-    def color_result(val):
-        if val == "User":
-            return "color: green; font-weight:600"
-        elif val == "Computer":
-            return "color: red; font-weight:600"
-        else:
-            return "color: gray; font-weight:600"
+    st.dataframe(styled_history_page(page), use_container_width=True, hide_index=True)
 
-    st.dataframe(df_hist.style.applymap(lambda v: "font-weight:600" if isinstance(v, str) else "", subset=["User","Computer"])
-                         .applymap(lambda v: color_result(v) if v in ["User","Computer","Tie"] else "", subset=["Result"]),
-                 use_container_width=True)
-
-    # Download CSV
-    csv_bytes = csv_bytes_from_df(df_hist)
+    # Download CSV, generated only when the button is clicked
     st.download_button(
         label="Download history as CSV",
-        data=csv_bytes,
+        data=partial(history.to_csv, variant.labels),
         file_name=f"rps_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
         mime="text/csv"
     )
 
 st.write("---")
 
+# All-time leaderboard (one precomputed row per player)
+st.subheader("🏆 Leaderboard")
+top = leaderboard(limit=10)
+if not top:
+    st.caption("No saved rounds yet — enter a player name in the sidebar to join the leaderboard.")
+else:
+    st.dataframe(
+        [{"Player": r["player"], "Rounds": r["rounds"], "Wins": r["wins"], "Losses": r["losses"],
+          "Ties": r["ties"], "Win rate": f"{r['win_rate']:.0%}"} for r in top],
+        use_container_width=True, hide_index=True,
+    )
+
+st.write("---")
+
 # Controls
 controls_left, controls_right = st.columns([1,1])
 with controls_left:
@@ -193,7 +262,7 @@ with controls_right:
 st.markdown(
     """
     <div style="margin-top:8px;padding:12px;border-radius:10px;background:#f8fafc;">
-      <small style="color:#475569;">This small app keeps state across interactions during the session. Close the browser tab or press Reset to clear scores.</small>
+      <small style="color:#475569;">This small app keeps state across interactions during the session. Close the browser tab or press Reset to clear scores; rounds played under a player name stay on the leaderboard.</small>
     </div>
     """, unsafe_allow_html=True
 )
@@ -0,0 +1,65 @@
+# rps_engine.py
+# Table-driven round engine for rps_app.py and batch simulations.
+#
+# A variant is an odd number of moves in cyclic order: move i beats move j
+# when (i - j) % n is odd, so every move beats exactly half of the others.
+# Rock, Paper, Scissors and Rock, Paper, Scissors, Spock, Lizard are both
+# such orders (and move (i + 1) % n always beats move i). Outcomes come from
+# an n x n table built once per variant.
+import numpy as np
+
+USER_WINS, COMPUTER_WINS, TIE = 0, 1, 2
+RESULTS = ("User", "Computer", "Tie")  # result code -> label
+
+
+class Variant:
+    def __init__(self, name: str, moves, emoji=None):
+        n = len(moves)
+        if n < 3 or n % 2 == 0:
+            raise ValueError(f"a balanced variant needs an odd number of moves (>= 3), got {n}")
+        self.name = name
+        self.moves = tuple(moves)
+        self.emoji = dict(emoji or {})
+        self.n = n
+        self.labels = tuple(f"{m} {self.emoji[m]}" if m in self.emoji else m for m in self.moves)
+        # outcome[user, comp] -> result code
+        self.outcome = np.array(
+            [[TIE if u == c else USER_WINS if (u - c) % n % 2 else COMPUTER_WINS for c in range(n)] for u in range(n)],
+            dtype=np.int8,
+        )
+        self._outcome_rows = self.outcome.tolist()  # plain lists: faster for one-off lookups
+
+    def index(self, move: str) -> int:
+        return self.moves.index(move)
+
+    def decide(self, user: int, comp: int) -> int:
+        """Result code of one round (move indexes)."""
+        return self._outcome_rows[user][comp]
+
+    def play_many(self, user_moves, comp_moves=None, rng=None) -> np.ndarray:
+        """Result codes for many rounds at once.
+
+        `comp_moves` defaults to uniformly random throws from `rng`
+        (a numpy Generator).
+        """
+        user_moves = np.asarray(user_moves, dtype=np.intp)
+        if comp_moves is None:
+            rng = rng or np.random.default_rng()
+            comp_moves = rng.integers(0, self.n, size=user_moves.shape)
+        return self.outcome[user_moves, np.asarray(comp_moves, dtype=np.intp)]
+
+    @staticmethod
+    def tally(results) -> tuple:
+        """(user wins, computer wins, ties) for an array of result codes."""
+        return tuple(int(x) for x in np.bincount(np.ravel(results), minlength=3)[:3])
+
+
+VARIANTS = {
+    v.name: v for v in (
+        Variant("Rock · Paper · Scissors", ("Rock", "Paper", "Scissors"),
+                {"Rock": "✊", "Paper": "✋", "Scissors": "✌️"}),
+        Variant("Rock · Paper · Scissors · Spock · Lizard", ("Rock", "Paper", "Scissors", "Spock", "Lizard"),
+                {"Rock": "✊", "Paper": "✋", "Scissors": "✌️", "Spock": "🖖", "Lizard": "🦎"}),
+    )
+}
+DEFAULT_VARIANT = "Rock · Paper · Scissors"
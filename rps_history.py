@@ -0,0 +1,95 @@
+# rps_history.py
+# Columnar round history for rps_app.py.
+#
+# Rounds are stored as parallel NumPy columns (round number, time, move and
+# result codes) instead of one dict per round. With a cap the columns form a
+# ring buffer that keeps the most recent `cap` rounds in fixed memory;
+# without one they grow by doubling. Appends are O(1); DataFrames and CSV
+# are only built from the columns when something actually needs them, and
+# window() slices out one page of rounds without touching the rest.
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from rps_engine import RESULTS
+
+COLUMNS = ["Round", "Time", "User", "Computer", "Result"]
+INITIAL_SIZE = 256
+
+
+class RoundHistory:
+    def __init__(self, cap: int = None):
+        self.cap = cap
+        self._alloc(cap or INITIAL_SIZE)
+        self.start = 0     # index of the oldest kept round
+        self.count = 0     # rounds kept
+
+    def _alloc(self, size: int):
+        self.round = np.zeros(size, dtype=np.int64)
+        self.time = np.zeros(size, dtype="datetime64[s]")
+        self.user = np.zeros(size, dtype=np.int8)
+        self.comp = np.zeros(size, dtype=np.int8)
+        self.result = np.zeros(size, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, round_no: int, user: int, comp: int, result: int, when: datetime = None):
+        size = len(self.round)
+        if self.cap is not None and self.count == self.cap:
+            idx = self.start                      # overwrite the oldest round
+            self.start = (self.start + 1) % size
+        else:
+            if self.count == size:
+                self._resize(size * 2)
+                size *= 2
+            idx = (self.start + self.count) % size
+            self.count += 1
+        self.round[idx] = round_no
+        self.time[idx] = np.datetime64((when or datetime.now()).replace(microsecond=0))
+        self.user[idx] = user
+        self.comp[idx] = comp
+        self.result[idx] = result  # rps_engine result code
+
+    def set_cap(self, cap: int = None):
+        """Change the cap, keeping the most recent rounds that fit."""
+        if cap == self.cap:
+            return
+        keep = self.count if cap is None else min(self.count, cap)
+        self._resize(max(cap or INITIAL_SIZE, keep), keep)
+        self.cap = cap
+
+    def _resize(self, size: int, keep: int = None):
+        keep = self.count if keep is None else keep
+        columns = self.columns()
+        self._alloc(size)
+        for name in ("round", "time", "user", "comp", "result"):
+            getattr(self, name)[:keep] = columns[name][self.count - keep:]
+        self.start, self.count = 0, keep
+
+    def columns(self) -> dict:
+        """Kept rounds, oldest first, as {column: array} copies."""
+        return self.window(0, self.count)
+
+    def window(self, start: int, stop: int) -> dict:
+        """Kept rounds start..stop-1 (0 is the oldest kept), as {column: array} copies."""
+        start, stop = max(0, start), min(self.count, stop)
+        order = (self.start + np.arange(start, max(start, stop))) % len(self.round)
+        return {name: getattr(self, name)[order] for name in ("round", "time", "user", "comp", "result")}
+
+    def to_frame(self, move_labels, start: int = 0, stop: int = None) -> pd.DataFrame:
+        """Kept rounds start..stop-1 (default: all) as a display DataFrame;
+        `move_labels[i]` names move code i."""
+        c = self.window(start, self.count if stop is None else stop)
+        labels = np.asarray(move_labels, dtype=object)
+        return pd.DataFrame({
+            "Round": c["round"],
+            "Time": pd.Series(c["time"]).dt.strftime("%Y-%m-%d %H:%M:%S"),
+            "User": labels[c["user"]],
+            "Computer": labels[c["comp"]],
+            "Result": np.asarray(RESULTS, dtype=object)[c["result"]],
+        }, columns=COLUMNS)
+
+    def to_csv(self, move_labels) -> bytes:
+        return self.to_frame(move_labels).to_csv(index=False).encode("utf-8")
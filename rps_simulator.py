@@ -0,0 +1,171 @@
+# rps_simulator.py
+# Vectorized Monte-Carlo "Best of N" matches for rps_app.py.
+#
+# All matches are played side by side: each round is a handful of NumPy
+# operations over arrays with one entry per match, so adaptive computer
+# strategies (rps_strategies.MarkovStrategy) and reactive user strategies
+# cost the same per round as random ones. Ties don't count, as in the app:
+# a match ends when one side has won best_of // 2 + 1 rounds.
+import time
+
+import numpy as np
+
+from rps_engine import COMPUTER_WINS, USER_WINS, Variant
+from rps_strategies import STRATEGIES, MarkovStrategy
+
+DEFAULT_MATCHES = 50_000
+MAX_ROUNDS_PER_WIN = 20  # round limit per win needed; matches still open after it count as undecided
+
+
+# -------------------------
+# Simulated users
+# -------------------------
+def _random(ctx):
+    return ctx["rng"].integers(0, ctx["n"], ctx["m"])
+
+def _favorite(ctx):
+    # 60% their favorite (the first move), otherwise random
+    rng = ctx["rng"]
+    return np.where(rng.random(ctx["m"]) < 0.6, 0, rng.integers(0, ctx["n"], ctx["m"]))
+
+def _cycle(ctx):
+    return (ctx["prev_user"] + 1) % ctx["n"]
+
+def _beat_last(ctx):
+    return (ctx["prev_comp"] + 1) % ctx["n"]
+
+def _win_stay_lose_shift(ctx):
+    return np.where(ctx["prev_result"] == USER_WINS, ctx["prev_user"], (ctx["prev_user"] + 1) % ctx["n"])
+
+# name -> vectorized move function; the first round is always random
+USER_STRATEGIES = {
+    "Random": _random,
+    "Favorite move": _favorite,
+    "Cycle through moves": _cycle,
+    "Beat the computer's last move": _beat_last,
+    "Win-stay, lose-shift": _win_stay_lose_shift,
+}
+
+
+# -------------------------
+# Computer strategies, vectorized
+# -------------------------
+class _VecMarkov:
+    """MarkovStrategy over many matches at once (one count table per match).
+
+    Matches are far shorter than COUNT_CAP, so counts are never halved.
+    """
+
+    def __init__(self, order, n, m, rng):
+        self.order, self.n, self.m, self.rng = order, n, m, rng
+        self.contexts = n ** order
+        self.counts = np.zeros((m, self.contexts, n), dtype=np.int32)
+        self.context = np.zeros(m, dtype=np.intp)
+        self.rows = np.arange(m)
+        self.seen = 0
+
+    def choose(self):
+        guess = self.rng.integers(0, self.n, self.m)
+        if self.seen < self.order:
+            return guess
+        counts = self.counts[self.rows, self.context]
+        # argmax with random tie-breaking: jitter below the count resolution
+        predicted = np.argmax(counts + self.rng.random(counts.shape) * 0.5, axis=1)
+        return np.where(counts.any(axis=1), (predicted + 1) % self.n, guess)
+
+    def observe(self, user):
+        if self.seen >= self.order:
+            self.counts[self.rows, self.context, user] += 1
+        self.context = (self.context * self.n + user) % self.contexts
+        self.seen += 1
+
+
+class _VecRandom:
+    def __init__(self, n, m, rng):
+        self.n, self.m, self.rng = n, m, rng
+
+    def choose(self):
+        return self.rng.integers(0, self.n, self.m)
+
+    def observe(self, user):
+        pass
+
+
+def _computer(strategy: str, n: int, m: int, rng):
+    prototype = STRATEGIES[strategy](n, None)
+    if isinstance(prototype, MarkovStrategy):
+        return _VecMarkov(prototype.order, n, m, rng)
+    return _VecRandom(n, m, rng)
+
+
+# -------------------------
+# Matches
+# -------------------------
+def _play(variant: Variant, user_strategy: str, comp_strategy: str, need: int, matches: int, seed: int,
+          user_start, comp_start) -> tuple:
+    """Play the matches side by side; starts are scalars or one entry per match.
+
+    Returns per-match (user wins, computer wins, rounds, still open).
+    """
+    n, m = variant.n, matches
+    rng = np.random.default_rng(seed)
+    user_move = USER_STRATEGIES[user_strategy]
+    computer = _computer(comp_strategy, n, m, rng)
+
+    user_wins = np.full(m, user_start, dtype=np.int32)
+    comp_wins = np.full(m, comp_start, dtype=np.int32)
+    rounds = np.zeros(m, dtype=np.int32)
+    open_ = (user_wins < need) & (comp_wins < need)
+    ctx = {"rng": rng, "n": n, "m": m, "prev_user": None, "prev_comp": None, "prev_result": None}
+
+    for rnd in range(need * MAX_ROUNDS_PER_WIN):
+        if not open_.any():
+            break
+        user = _random(ctx) if rnd == 0 else user_move(ctx)
+        comp = computer.choose()
+        result = variant.outcome[user, comp]
+        user_wins += open_ & (result == USER_WINS)
+        comp_wins += open_ & (result == COMPUTER_WINS)
+        rounds += open_
+        open_ &= (user_wins < need) & (comp_wins < need)
+        computer.observe(user)
+        ctx.update(prev_user=user, prev_comp=comp, prev_result=result)
+    return user_wins, comp_wins, rounds, open_
+
+
+def simulate_matches(variant: Variant, user_strategy: str, comp_strategy: str, best_of: int,
+                     matches: int = DEFAULT_MATCHES, seed: int = 0, user_start: int = 0, comp_start: int = 0) -> dict:
+    """Play `matches` best-of-`best_of` matches from the score user_start:comp_start.
+
+    Returns the user's and computer's match-win probabilities, the share of
+    undecided matches, the mean rounds played and matches per second.
+    """
+    started = time.perf_counter()
+    need = best_of // 2 + 1
+    m = matches
+    user_wins, comp_wins, rounds, open_ = _play(variant, user_strategy, comp_strategy, need, m, seed,
+                                                user_start, comp_start)
+    elapsed = time.perf_counter() - started
+    return {
+        "user_win_prob": float(np.mean(user_wins >= need)),
+        "comp_win_prob": float(np.mean(comp_wins >= need)),
+        "undecided": float(np.mean(open_)),
+        "mean_rounds": float(rounds.mean()),
+        "matches_per_sec": m / elapsed if elapsed else float("inf"),
+    }
+
+
+def win_odds_by_score(variant: Variant, user_strategy: str, comp_strategy: str, best_of: int,
+                      matches: int = DEFAULT_MATCHES, seed: int = 0) -> np.ndarray:
+    """The user's match-win probability from every score still in play.
+
+    One simulation spreads `matches` evenly over the starting scores;
+    entry [u, c] is the estimate from u:c (u, c < best_of // 2 + 1).
+    """
+    need = best_of // 2 + 1
+    per_score = max(1, matches // (need * need))
+    starts = np.repeat(np.arange(need * need), per_score)
+    user_wins, _, _, _ = _play(variant, user_strategy, comp_strategy, need, len(starts), seed,
+                               starts // need, starts % need)
+    won = np.bincount(starts, weights=user_wins >= need, minlength=need * need)
+    return (won / per_score).reshape(need, need)
@@ -0,0 +1,99 @@
+# rps_stats.py
+# Persistent, cross-session player stats for rps_app.py (SQLite).
+#
+# Every round is appended to `rounds`; in the same transaction the player's
+# row in `leaderboard` is bumped, so reading the leaderboard is a small
+# indexed query over one row per player instead of a scan of every round.
+# WAL mode plus BEGIN IMMEDIATE writes (sqlite_store) keep concurrent
+# sessions safe.
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from rps_engine import COMPUTER_WINS, TIE, USER_WINS
+from sqlite_store import connect, write_transaction
+
+# -------------------------
+# Config
+# -------------------------
+STATS_DB_PATH = Path(os.environ.get("RPS_STATS_DB", Path(__file__).with_name("rps_stats.sqlite3")))
+MAX_PLAYER_NAME = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    player     TEXT NOT NULL,
+    variant    TEXT NOT NULL,
+    strategy   TEXT NOT NULL,
+    user_move  INTEGER NOT NULL,
+    comp_move  INTEGER NOT NULL,
+    result     INTEGER NOT NULL,  -- rps_engine result code
+    played_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_player ON rounds (player, id);
+CREATE TABLE IF NOT EXISTS leaderboard (
+    player       TEXT PRIMARY KEY,
+    rounds       INTEGER NOT NULL DEFAULT 0,
+    wins         INTEGER NOT NULL DEFAULT 0,
+    losses       INTEGER NOT NULL DEFAULT 0,
+    ties         INTEGER NOT NULL DEFAULT 0,
+    last_played  REAL
+);
+CREATE INDEX IF NOT EXISTS leaderboard_rank ON leaderboard (wins DESC, rounds);
+"""
+
+def _connect(db_path=None) -> sqlite3.Connection:
+    return connect(db_path or STATS_DB_PATH, _SCHEMA)
+
+def clean_player_name(name: str) -> str:
+    """Trimmed, length-limited player name ("" means anonymous)."""
+    return " ".join((name or "").split())[:MAX_PLAYER_NAME]
+
+# -------------------------
+# Writes
+# -------------------------
+def record_round(player: str, variant: str, strategy: str, user_move: int, comp_move: int, result: int,
+                 db_path=None) -> None:
+    """Store one round and fold it into the player's leaderboard row."""
+    now = time.time()
+    with closing(_connect(db_path)) as conn:
+        with write_transaction(conn):
+            conn.execute(
+                "INSERT INTO rounds (player, variant, strategy, user_move, comp_move, result, played_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (player, variant, strategy, user_move, comp_move, result, now),
+            )
+            conn.execute(
+                """
+                INSERT INTO leaderboard (player, rounds, wins, losses, ties, last_played)
+                VALUES (?, 1, ?, ?, ?, ?)
+                ON CONFLICT (player) DO UPDATE SET
+                    rounds = rounds + 1,
+                    wins = wins + excluded.wins,
+                    losses = losses + excluded.losses,
+                    ties = ties + excluded.ties,
+                    last_played = excluded.last_played
+                """,
+                (player, int(result == USER_WINS), int(result == COMPUTER_WINS), int(result == TIE), now),
+            )
+
+# -------------------------
+# Reads
+# -------------------------
+def leaderboard(limit: int = 10, db_path=None) -> list:
+    """Top players by wins (fewer rounds breaks ties) as dicts."""
+    with closing(_connect(db_path)) as conn:
+        rows = conn.execute(
+            "SELECT player, rounds, wins, losses, ties, last_played FROM leaderboard"
+            " ORDER BY wins DESC, rounds LIMIT ?",
+            (limit,),
+        ).fetchall()
+    return [dict(r, win_rate=r["wins"] / r["rounds"] if r["rounds"] else 0.0) for r in rows]
+
+def player_stats(player: str, db_path=None):
+    """The player's leaderboard row as a dict, or None if they have not played."""
+    with closing(_connect(db_path)) as conn:
+        row = conn.execute("SELECT * FROM leaderboard WHERE player = ?", (player,)).fetchone()
+    return dict(row) if row else None
@@ -0,0 +1,101 @@
+# rps_strategies.py
+# Computer opponents for rps_app.py.
+#
+# Moves are indexes 0..n-1 into the game's move list. In the cyclic move
+# orders used here (Rock, Paper, Scissors, ...) move (i + 1) % n beats move i,
+# so the counter to a predicted move is always the next one.
+import random
+
+# Per-context count total at which a table row is halved: memory stays fixed
+# and old habits fade, so the model follows a user who changes style.
+COUNT_CAP = 64
+
+
+def counter_move(move: int, n_moves: int) -> int:
+    return (move + 1) % n_moves
+
+
+class RandomStrategy:
+    """Uniformly random throws (unexploitable, but learns nothing)."""
+
+    def __init__(self, n_moves: int = 3, rng=random):
+        self.n_moves = n_moves
+        self.rng = rng
+
+    def observe(self, user_move: int) -> None:
+        pass
+
+    def choose(self) -> int:
+        return self.rng.randrange(self.n_moves)
+
+
+class MarkovStrategy:
+    """Predicts the user's next throw from their last `order` throws and counters it.
+
+    Keeps one count row per context (n_moves ** order rows of n_moves counts);
+    order 0 is a plain frequency model. observe() and choose() are O(n_moves)
+    whatever the number of rounds played.
+    """
+
+    def __init__(self, order: int, n_moves: int = 3, rng=random):
+        self.order = order
+        self.n_moves = n_moves
+        self.rng = rng
+        self.contexts = n_moves ** order
+        self.counts = [[0] * n_moves for _ in range(self.contexts)]
+        self.totals = [0] * self.contexts
+        self.context = 0  # last `order` user moves as a base-n_moves number
+        self.seen = 0
+
+    def observe(self, user_move: int) -> None:
+        if self.seen >= self.order:  # the context is complete
+            ctx = self.context
+            row = self.counts[ctx]
+            row[user_move] += 1
+            self.totals[ctx] += 1
+            if self.totals[ctx] > COUNT_CAP:
+                for i in range(self.n_moves):
+                    row[i] >>= 1
+                self.totals[ctx] = sum(row)
+        self.context = (self.context * self.n_moves + user_move) % self.contexts
+        self.seen += 1
+
+    def predict(self):
+        """Most likely next user move (ties broken at random), or None without data."""
+        if self.seen < self.order or not self.totals[self.context]:
+            return None
+        row = self.counts[self.context]
+        best = max(row)
+        return self.rng.choice([i for i, c in enumerate(row) if c == best])
+
+    def choose(self) -> int:
+        predicted = self.predict()
+        if predicted is None:
+            return self.rng.randrange(self.n_moves)
+        return counter_move(predicted, self.n_moves)
+
+
+# Strategy name -> factory(n_moves, rng)
+STRATEGIES = {
+    "Random": lambda n, rng: RandomStrategy(n, rng),
+    "Frequency": lambda n, rng: MarkovStrategy(0, n, rng),
+    "Markov (last move)": lambda n, rng: MarkovStrategy(1, n, rng),
+    "Markov (last 2 moves)": lambda n, rng: MarkovStrategy(2, n, rng),
+}
+DEFAULT_STRATEGY = "Markov (last 2 moves)"
+
+
+class Opponent:
+    """Every strategy, all trained on each round, so switching is instant."""
+
+    def __init__(self, n_moves: int = 3, rng=None):
+        self.n_moves = n_moves
+        self.rng = rng or random.Random()
+        self.strategies = {name: factory(n_moves, self.rng) for name, factory in STRATEGIES.items()}
+
+    def choose(self, strategy: str) -> int:
+        return self.strategies[strategy].choose()
+
+    def observe(self, user_move: int) -> None:
+        for strategy in self.strategies.values():
+            strategy.observe(user_move)
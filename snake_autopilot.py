@@ -0,0 +1,246 @@
+# snake_autopilot.py
+# Path-planning autopilot for SnakeEngine (auto play, benchmarks).
+import random
+from collections import deque
+
+from snake_engine import OPPOSITE, SnakeEngine
+
+
+def _neighbors(size: int) -> list:
+    """cell -> [(neighbor_cell, direction), ...] for a size x size grid."""
+    table = []
+    for cell in range(size * size):
+        r, c = divmod(cell, size)
+        nbrs = []
+        if r > 0:
+            nbrs.append((cell - size, "UP"))
+        if r < size - 1:
+            nbrs.append((cell + size, "DOWN"))
+        if c > 0:
+            nbrs.append((cell - 1, "LEFT"))
+        if c < size - 1:
+            nbrs.append((cell + 1, "RIGHT"))
+        table.append(nbrs)
+    return table
+
+
+def hamiltonian_cycle(size: int):
+    """cell -> next cell along a Hamiltonian cycle, or None for odd sizes.
+
+    Runs along row 0, snakes through columns 1.. of the remaining rows and
+    returns up column 0.
+    """
+    if size % 2 or size < 2:
+        return None
+    order = [(0, c) for c in range(size)]
+    for r in range(1, size):
+        cols = range(size - 1, 0, -1) if r % 2 else range(1, size)
+        order.extend((r, c) for c in cols)
+    order.extend((r, 0) for r in range(size - 1, 0, -1))
+    cells = [r * size + c for r, c in order]
+    successor = [0] * (size * size)
+    for i, cell in enumerate(cells):
+        successor[cell] = cells[(i + 1) % len(cells)]
+    return successor
+
+
+class Autopilot:
+    """Chooses directions for one SnakeEngine game.
+
+    Each move, in order of preference:
+      1. follow the cached plan to the current food, if there is one;
+      2. plan a BFS shortest path to the food and accept it only if, after the
+         snake virtually follows it, the head can still reach the tail;
+      3. take the next Hamiltonian-cycle cell (even grid sizes) if that keeps
+         the tail reachable;
+      4. chase the tail the long way round (the move whose new head is
+         farthest from the tail), which keeps re-shaping the body instead of
+         circling forever;
+      5. otherwise move into the largest open area.
+    A validated plan stays valid until the food moves, so BFS runs roughly
+    once per apple instead of once per tick.
+    """
+
+    def __init__(self, engine: SnakeEngine):
+        self.engine = engine
+        self.size = engine.size
+        self.neighbors = _neighbors(engine.size)
+        self.adjacent = [[nbr for nbr, _ in nbrs] for nbrs in self.neighbors]
+        self.cycle = hamiltonian_cycle(engine.size)
+        self.plan = deque()
+        self.plan_food = None
+        self.rng = random.Random(engine.seed)  # deterministic per game for replays
+        self.hungry_since = (engine.ticks, engine.score)
+
+    def direction(self) -> str:
+        e = self.engine
+        if not e.alive:
+            return e.direction
+        if self.plan and self.plan_food == e.food:
+            return self._direction_to(self.plan.popleft())
+
+        self.plan.clear()
+        path = self._bfs(e.body[0], e.food, e.occupied, e.body[-1]) if e.food is not None else None
+        if path and self._tail_reachable_after(path):
+            self.plan.extend(path)
+            self.plan_food = e.food
+            return self._direction_to(self.plan.popleft())
+
+        head = e.body[0]
+        if self.cycle is not None:
+            nxt = self.cycle[head]
+            # stepping onto the tail is left to the tail chase, which may
+            # find a move that re-shapes the body instead
+            if not e.occupied[nxt] and self._tail_reachable_after([nxt]):
+                return self._direction_to(nxt)
+
+        direction = self._tail_chase_direction()
+        if direction is not None:
+            return direction
+        return self._roomiest_direction()
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _direction_to(self, cell: int) -> str:
+        for nbr, direction in self.neighbors[self.engine.body[0]]:
+            if nbr == cell:
+                return direction
+        return self.engine.direction
+
+    def _bfs(self, start: int, goal: int, occupied, passable: int):
+        """Shortest path start -> goal (excluding start) avoiding occupied cells
+        other than `passable`; None if unreachable."""
+        if start == goal:
+            return []
+        blocked = bytearray(occupied)  # doubles as the visited set
+        blocked[passable] = 0
+        blocked[start] = 1
+        parent = {}
+        adjacent = self.adjacent
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for cell in frontier:
+                for nbr in adjacent[cell]:
+                    if not blocked[nbr]:
+                        blocked[nbr] = 1
+                        parent[nbr] = cell
+                        if nbr == goal:
+                            path = [nbr]
+                            while cell != start:
+                                path.append(cell)
+                                cell = parent[cell]
+                            path.reverse()
+                            return path
+                        next_frontier.append(nbr)
+            frontier = next_frontier
+        return None
+
+    def _distances(self, start: int, occupied, targets) -> dict:
+        """BFS distances from `start` to whichever `targets` are reachable
+        through free cells; stops once every target is found."""
+        remaining = set(targets)
+        found = {}
+        blocked = bytearray(occupied)
+        blocked[start] = 1
+        adjacent = self.adjacent
+        frontier, dist = [start], 0
+        while frontier and remaining:
+            dist += 1
+            next_frontier = []
+            for cell in frontier:
+                for nbr in adjacent[cell]:
+                    if not blocked[nbr]:
+                        blocked[nbr] = 1
+                        if nbr in remaining:
+                            remaining.discard(nbr)
+                            found[nbr] = dist
+                        next_frontier.append(nbr)
+            frontier = next_frontier
+        return found
+
+    def _tail_reachable_after(self, path: list) -> bool:
+        """Simulate following `path`; can the new head still reach the new tail?"""
+        e = self.engine
+        body = deque(e.body)
+        occupied = bytearray(e.occupied)
+        for cell in path:
+            if cell != e.food:
+                occupied[body.pop()] = 0
+            if occupied[cell]:
+                return False
+            body.appendleft(cell)
+            occupied[cell] = 1
+        if len(body) == self.size * self.size:
+            return True
+        return self._bfs(body[0], body[-1], occupied, body[-1]) is not None
+
+    def _tail_chase_direction(self):
+        e = self.engine
+        if e.score != self.hungry_since[1]:
+            self.hungry_since = (e.ticks, e.score)
+        # A long stretch without food means the chase is going in circles:
+        # pick any safe move at random to break the loop.
+        restless = e.ticks - self.hungry_since[0] > self.size * self.size
+
+        moves = [
+            (nbr, direction) for nbr, direction in self.neighbors[e.body[0]]
+            if not (e.occupied[nbr] and nbr != e.body[-1]) and direction != OPPOSITE[e.heading]
+        ]
+        tail_distance = self._tail_distances_after([nbr for nbr, _ in moves if nbr != e.food])
+        safe = []
+        for nbr, direction in moves:
+            if nbr == e.food:
+                # eating keeps the tail in place; only reachability matters
+                if self._tail_reachable_after([nbr]):
+                    safe.append((0, direction))
+            elif nbr in tail_distance:
+                safe.append((tail_distance[nbr], direction))
+        if not safe:
+            return None
+        if restless:
+            return self.rng.choice(safe)[1]
+        return max(safe)[1]
+
+    def _tail_distances_after(self, cells) -> dict:
+        """cell -> length of the path from `cell` to the tail after the head
+        steps onto `cell` (without eating), for the cells that have one.
+
+        The head's step frees the old tail and occupies `cell`; a shortest
+        path starting at `cell` never revisits it, so one BFS from the new
+        tail serves every candidate cell.
+        """
+        e = self.engine
+        if len(e.body) == 1:
+            return {cell: 0 for cell in cells}
+        occupied = bytearray(e.occupied)
+        occupied[e.body[-1]] = 0
+        return self._distances(e.body[-2], occupied, cells)
+
+    def _roomiest_direction(self) -> str:
+        e = self.engine
+        best, best_room = e.direction, -1
+        areas = []  # open areas already flooded; neighbors in the same one share its size
+        for nbr, direction in self.neighbors[e.body[0]]:
+            if e.occupied[nbr] and nbr != e.body[-1]:
+                continue
+            area = next((a for a in areas if nbr in a), None)
+            if area is None:
+                area = self._flood(nbr)
+                areas.append(area)
+            if len(area) > best_room:
+                best, best_room = direction, len(area)
+        return best
+
+    def _flood(self, start: int) -> set:
+        occupied = self.engine.occupied
+        adjacent = self.adjacent
+        seen = {start}
+        stack = [start]
+        while stack:
+            for nbr in adjacent[stack.pop()]:
+                if nbr not in seen and not occupied[nbr]:
+                    seen.add(nbr)
+                    stack.append(nbr)
+        return seen
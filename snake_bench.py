@@ -0,0 +1,113 @@
+# snake_bench.py
+# Batch self-play benchmark for the snake autopilot.
+#
+#   python snake_bench.py --games 200 --size 20 --workers 4 --save-dir replays/
+#
+# Runs seeded headless games across a process pool and reports engine speed,
+# scores and death causes. With --save-dir every game is written as a .snk
+# move log that snakegame.py can replay move for move.
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from snake_autopilot import Autopilot
+from snake_engine import SnakeEngine, encode_replay, greedy_direction
+
+POLICIES = ("autopilot", "greedy")
+STARVED = "starved"  # benchmark-only end: too long without eating
+
+
+def play_game(seed: int, size: int, policy: str, max_idle_ticks: int, save_dir: str = None) -> dict:
+    """Play one seeded game to the end; returns its summary."""
+    engine = SnakeEngine(size, seed=seed, record=save_dir is not None)
+    if policy == "autopilot":
+        choose = Autopilot(engine).direction
+    else:
+        choose = lambda: greedy_direction(engine)
+
+    started = time.perf_counter()
+    last_meal, last_score = 0, 0
+    while engine.alive:
+        engine.step(choose())
+        if engine.score != last_score:
+            last_meal, last_score = engine.ticks, engine.score
+        elif engine.ticks - last_meal > max_idle_ticks:
+            break
+    elapsed = time.perf_counter() - started
+
+    if save_dir is not None:
+        Path(save_dir, f"snake_{size}x{size}_{seed}.snk").write_bytes(encode_replay(engine))
+    return {
+        "seed": seed,
+        "score": engine.score,
+        "ticks": engine.ticks,
+        "cause": engine.death_cause or STARVED,
+        "seconds": elapsed,
+    }
+
+
+def _play_game_args(args: tuple) -> dict:
+    return play_game(*args)
+
+
+def run_benchmark(games: int, size: int, policy: str, workers: int, first_seed: int = 0,
+                  max_idle_ticks: int = None, save_dir: str = None) -> dict:
+    if max_idle_ticks is None:
+        max_idle_ticks = 4 * size * size
+    if save_dir is not None:
+        os.makedirs(save_dir, exist_ok=True)
+
+    jobs = [(seed, size, policy, max_idle_ticks, save_dir) for seed in range(first_seed, first_seed + games)]
+    started = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_play_game_args, jobs, chunksize=max(1, games // (workers * 4))))
+    else:
+        results = [_play_game_args(job) for job in jobs]
+    wall = time.perf_counter() - started
+
+    scores = [r["score"] for r in results]
+    ticks = sum(r["ticks"] for r in results)
+    return {
+        "games": games,
+        "wall_seconds": wall,
+        "ticks": ticks,
+        "ticks_per_sec": ticks / wall if wall else float("inf"),
+        "ticks_per_sec_per_worker": ticks / sum(r["seconds"] for r in results) if ticks else 0.0,
+        "mean_score": sum(scores) / len(scores) if scores else 0.0,
+        "max_score": max(scores, default=0),
+        "causes": Counter(r["cause"] for r in results),
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the snake autopilot with seeded self-play.")
+    parser.add_argument("--games", type=int, default=100, help="number of games (default: 100)")
+    parser.add_argument("--size", type=int, default=20, help="grid size (default: 20)")
+    parser.add_argument("--policy", choices=POLICIES, default="autopilot")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game; games use seed, seed+1, ...")
+    parser.add_argument("--max-idle-ticks", type=int, default=None,
+                        help="end a game as 'starved' after this many ticks without food (default: 4 * size^2)")
+    parser.add_argument("--save-dir", default=None, help="write a .snk replay per game into this directory")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.games, args.size, args.policy, args.workers, args.seed,
+                           args.max_idle_ticks, args.save_dir)
+    max_possible = args.size * args.size - 3
+    print(f"🐍 {report['games']} games · {args.size}x{args.size} · policy={args.policy} · workers={args.workers}")
+    print(f"   wall time      {report['wall_seconds']:.2f}s")
+    print(f"   ticks          {report['ticks']:,}  ({report['ticks_per_sec']:,.0f}/s total, "
+          f"{report['ticks_per_sec_per_worker']:,.0f}/s per worker)")
+    print(f"   score          mean {report['mean_score']:.1f} · max {report['max_score']} (of {max_possible})")
+    print("   end causes     " + ", ".join(f"{cause}: {n}" for cause, n in report["causes"].most_common()))
+    if args.save_dir:
+        print(f"   replays        {args.save_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+# snake_engine.py
+# Headless snake simulation. No Streamlit imports: snakegame.py is a view
+# over SnakeEngine, and the same engine runs in tests and batch evaluation.
+import random
+import struct
+from array import array
+from collections import deque
+
+DIRECTIONS = {
+    "UP": (-1, 0),
+    "DOWN": (1, 0),
+    "LEFT": (0, -1),
+    "RIGHT": (0, 1),
+}
+OPPOSITE = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+DIRECTION_CODES = {"UP": 0, "DOWN": 1, "LEFT": 2, "RIGHT": 3}  # one byte per move in replays
+CODE_DIRECTIONS = {code: name for name, code in DIRECTION_CODES.items()}
+
+# step() results
+MOVED = "moved"
+ATE = "ate"
+HIT_WALL = "wall"
+HIT_SELF = "self"
+BOARD_FULL = "full"  # snake covers every cell: the game is won
+
+START_SNAKE = ((5, 5), (5, 4), (5, 3))
+
+
+class SnakeEngine:
+    """Snake game state on a `size` x `size` grid.
+
+    Cells are addressed by index ``row * size + col``. The body is a deque of
+    cell indexes (head first) mirrored by a one-byte-per-cell occupancy bitmap,
+    so moving and collision checks never scan the body. Unoccupied cells are
+    kept in a list with a reverse index (swap-remove), so food is drawn
+    uniformly from free cells in O(1) however full the board gets. Food
+    placement uses its own RNG seeded from `seed`; the same seed and move
+    sequence always replays the same game.
+    """
+
+    def __init__(self, size: int = 20, seed: int = None, start=START_SNAKE, direction: str = "RIGHT", record: bool = False):
+        self.size = size
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.body = deque()
+        self.occupied = bytearray(size * size)
+        self.free = list(range(size * size))
+        self.free_index = array("l", self.free)  # cell -> position in self.free
+        for r, c in start:
+            cell = r * size + c
+            self.body.append(cell)
+            self._occupy(cell)
+        self.direction = direction  # heading for the next step
+        self.heading = direction    # direction of the last step taken
+        self.score = 0
+        self.ticks = 0
+        self.alive = True
+        self.death_cause = None
+        self.moves = bytearray() if record else None  # direction code per tick
+        self.food = self._spawn_food()
+
+    # -----------------------------
+    # Views (row, col) for renderers
+    # -----------------------------
+    @property
+    def head(self) -> tuple:
+        return divmod(self.body[0], self.size)
+
+    @property
+    def snake(self) -> list:
+        return [divmod(cell, self.size) for cell in self.body]
+
+    @property
+    def food_pos(self) -> tuple:
+        return None if self.food is None else divmod(self.food, self.size)
+
+    # -----------------------------
+    # Rules
+    # -----------------------------
+    def turn(self, direction: str):
+        """Change heading; reversing straight into the neck is ignored."""
+        if direction in DIRECTIONS and direction != OPPOSITE[self.heading]:
+            self.direction = direction
+
+    def step(self, direction: str = None) -> str:
+        """Advance one tick, optionally turning first. Returns the tick's event."""
+        if not self.alive:
+            return self.death_cause
+        if direction is not None:
+            self.turn(direction)
+        self.ticks += 1
+        self.heading = self.direction
+        if self.moves is not None:
+            self.moves.append(DIRECTION_CODES[self.direction])
+
+        r, c = divmod(self.body[0], self.size)
+        dr, dc = DIRECTIONS[self.direction]
+        r, c = r + dr, c + dc
+        if not (0 <= r < self.size and 0 <= c < self.size):
+            return self._die(HIT_WALL)
+        new_head = r * self.size + c
+        eating = new_head == self.food
+        # Unless it is growing, the tail moves out of the way this tick
+        if self.occupied[new_head] and (eating or new_head != self.body[-1]):
+            return self._die(HIT_SELF)
+
+        if not eating:
+            self._vacate(self.body.pop())
+        self.body.appendleft(new_head)
+        self._occupy(new_head)
+        if not eating:
+            return MOVED
+        self.score += 1
+        self.food = self._spawn_food()
+        if self.food is None:
+            return self._die(BOARD_FULL)
+        return ATE
+
+    def _die(self, cause: str) -> str:
+        self.alive = False
+        self.death_cause = cause
+        return cause
+
+    def _occupy(self, cell: int):
+        # swap-remove `cell` from the free list
+        i = self.free_index[cell]
+        last = self.free.pop()
+        if last != cell:
+            self.free[i] = last
+            self.free_index[last] = i
+        self.occupied[cell] = 1
+
+    def _vacate(self, cell: int):
+        self.free_index[cell] = len(self.free)
+        self.free.append(cell)
+        self.occupied[cell] = 0
+
+    def _spawn_food(self):
+        if not self.free:
+            return None
+        return self.free[self.rng.randrange(len(self.free))]
+
+
+
+# -----------------------------
+# Replays: b"SNK1" + <size:u16><seed:u32> + one direction code per tick
+# -----------------------------
+REPLAY_MAGIC = b"SNK1"
+_REPLAY_HEADER = struct.Struct("<HI")
+
+
+def encode_replay(engine: SnakeEngine) -> bytes:
+    """Serialize a game recorded with ``SnakeEngine(..., record=True)``."""
+    return REPLAY_MAGIC + _REPLAY_HEADER.pack(engine.size, engine.seed) + bytes(engine.moves)
+
+
+def decode_replay(data: bytes) -> tuple:
+    """Return ``(size, seed, moves)`` from bytes written by encode_replay."""
+    if data[:4] != REPLAY_MAGIC or len(data) < 4 + _REPLAY_HEADER.size:
+        raise ValueError("not a snake replay file")
+    size, seed = _REPLAY_HEADER.unpack_from(data, 4)
+    moves = data[4 + _REPLAY_HEADER.size:]
+    if any(code not in CODE_DIRECTIONS for code in set(moves)):
+        raise ValueError("corrupt snake replay: unknown move code")
+    return size, seed, moves
+
+
+# -----------------------------
+# Delta rendering
+# -----------------------------
+EMPTY, BODY, HEAD, FOOD = 0, 1, 2, 3
+
+
+class BoardDelta:
+    """Turns successive engine states into per-tick cell updates.
+
+    Keeps the last emitted frame and, for consecutive ticks, only looks at the
+    handful of cells a step can touch (old/new head, old tail, old/new food),
+    so each update costs O(changed cells), typically 3-4. A new engine, skipped
+    ticks or an explicit reset() produce a full keyframe instead.
+    """
+
+    def __init__(self):
+        self.seq = 0
+        self.reset()
+
+    def reset(self):
+        self.engine = None
+        self.frame = None
+        self.ticks = None
+        self.watch = ()
+
+    def _kind(self, engine: SnakeEngine, cell: int) -> int:
+        if cell == engine.food:
+            return FOOD
+        if engine.occupied[cell]:
+            return HEAD if cell == engine.body[0] else BODY
+        return EMPTY
+
+    def update(self, engine: SnakeEngine) -> dict:
+        """Return ``{"seq", "keyframe", "cells": [[cell, kind], ...]}`` for `engine`."""
+        self.seq += 1
+        keyframe = engine is not self.engine or engine.ticks not in (self.ticks, self.ticks + 1)
+        if keyframe:
+            self.engine = engine
+            self.frame = bytearray(engine.size * engine.size)
+            candidates = list(engine.body) + ([engine.food] if engine.food is not None else [])
+        else:
+            candidates = set(self.watch)
+            candidates.update((engine.body[0], engine.body[-1]))
+            if engine.food is not None:
+                candidates.add(engine.food)
+
+        cells = []
+        for cell in candidates:
+            kind = self._kind(engine, cell)
+            if kind != self.frame[cell]:
+                self.frame[cell] = kind
+                cells.append([cell, kind])
+
+        self.ticks = engine.ticks
+        self.watch = tuple(c for c in (engine.body[0], engine.body[-1], engine.food) if c is not None)
+        return {"seq": self.seq, "keyframe": keyframe, "cells": cells}
+
+
+def greedy_direction(engine: SnakeEngine) -> str:
+    """Simple greedy AI: head towards the food along the larger axis gap."""
+    hx, hy = engine.head
+    fx, fy = engine.food_pos
+    direction = engine.heading
+
+    if abs(fx - hx) > abs(fy - hy):  # Prioritize vertical/horizontal closeness
+        if fx < hx and direction != "DOWN":
+            return "UP"
+        elif fx > hx and direction != "UP":
+            return "DOWN"
+    else:
+        if fy < hy and direction != "RIGHT":
+            return "LEFT"
+        elif fy > hy and direction != "LEFT":
+            return "RIGHT"
+    return direction
@@ -1,176 +1,167 @@
 import streamlit as st
-import random
+import streamlit.components.v1 as components
 import time
+from pathlib import Path
+
+from snake_autopilot import Autopilot
+from snake_engine import BOARD_FULL, CODE_DIRECTIONS, START_SNAKE, BoardDelta, SnakeEngine, decode_replay
 
 # -----------------------------
 # Config
 # -----------------------------
 GRID_SIZE = 20
 SPEED = 0.15  # snake speed
+CELL_PX = 22  # board cell size in the browser-side board
+
+# Browser-side game: ticks and draws in the client, reports only score and
+# game-over events, so a human game costs no server reruns while playing.
+snake_client = components.declare_component("snake_client", path=str(Path(__file__).with_name("snake_client")))
 
 # -----------------------------
 # Initialize session state
 # -----------------------------
-if "snake" not in st.session_state:
-    st.session_state.snake = [(5, 5), (5, 4), (5, 3)]
-    st.session_state.direction = "RIGHT"
-    st.session_state.food = (10, 10)
-    st.session_state.score = 0
-    st.session_state.game_over = False
+# All game rules live in SnakeEngine; this page only renders it and feeds it
+# directions.
+if "engine" not in st.session_state:
+    st.session_state.engine = SnakeEngine(GRID_SIZE)
+    st.session_state.autopilot = Autopilot(st.session_state.engine)
     st.session_state.run = False
     st.session_state.auto_play = False  # NEW: Auto mode toggle
+    st.session_state.client_score = 0
+    st.session_state.best_score = 0
+    st.session_state.board_delta = BoardDelta()  # last frame sent to the auto-play view
+    st.session_state.replay = None  # [moves, next index] while a saved game plays back
 
 # -----------------------------
 # Helper Functions
 # -----------------------------
-def new_food():
-    """Generate new food not colliding with snake."""
-    while True:
-        pos = (random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1))
-        if pos not in st.session_state.snake:
-            return pos
-
-def move_snake():
-    """Move snake one step forward."""
-    head = st.session_state.snake[0]
-    x, y = head
-
-    if st.session_state.direction == "UP":
-        new_head = (x - 1, y)
-    elif st.session_state.direction == "DOWN":
-        new_head = (x + 1, y)
-    elif st.session_state.direction == "LEFT":
-        new_head = (x, y - 1)
-    else:  # RIGHT
-        new_head = (x, y + 1)
-
-    # Check collisions
-    if (
-        new_head[0] < 0 or new_head[0] >= GRID_SIZE or
-        new_head[1] < 0 or new_head[1] >= GRID_SIZE or
-        new_head in st.session_state.snake
-    ):
-        st.session_state.game_over = True
-        return
-
-    # Add new head
-    st.session_state.snake.insert(0, new_head)
-
-    # Check food
-    if new_head == st.session_state.food:
-        st.session_state.score += 1
-        st.session_state.food = new_food()
-    else:
-        st.session_state.snake.pop()
-
 def reset_game():
-    st.session_state.snake = [(5, 5), (5, 4), (5, 3)]
-    st.session_state.direction = "RIGHT"
-    st.session_state.food = new_food()
-    st.session_state.score = 0
-    st.session_state.game_over = False
+    st.session_state.engine = SnakeEngine(GRID_SIZE)
+    st.session_state.autopilot = Autopilot(st.session_state.engine)  # plans are per game
+    st.session_state.replay = None
     st.session_state.run = True
 
-def draw_board():
-    """Draw the board with emojis."""
-    board = [["⬛" for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-
-    # food
-    fx, fy = st.session_state.food
-    board[fx][fy] = "🍎"
+def start_replay(data: bytes):
+    """Load a .snk move log (see snake_bench.py) and play it back from its seed."""
+    size, seed, moves = decode_replay(data)
+    st.session_state.engine = SnakeEngine(size, seed=seed)
+    st.session_state.replay = [moves, 0]
+    st.session_state.run = True
 
-    # snake
-    for i, (x, y) in enumerate(st.session_state.snake):
-        board[x][y] = "🟩" if i > 0 else "🟥"
+def next_direction():
+    replay = st.session_state.replay
+    if replay is None:
+        return st.session_state.autopilot.direction()
+    moves, i = replay
+    if i >= len(moves):
+        st.session_state.run = False  # log finished (e.g. benchmark stopped a starved game)
+        return None
+    replay[1] = i + 1
+    return CODE_DIRECTIONS[moves[i]]
 
-    return "<br>".join("".join(row) for row in board)
+# -----------------------------
+# UI Layout
+# -----------------------------
+st.title("🐍 Snake Game in Streamlit (Enhanced with Auto Play)")
 
-def auto_play_move():
-    """Simple greedy AI: move snake towards food."""
-    head = st.session_state.snake[0]
-    fx, fy = st.session_state.food
-    hx, hy = head
+# 🎮 Auto Play toggle
+st.session_state.auto_play = st.checkbox("🤖 Auto Play", value=st.session_state.auto_play)
 
-    if abs(fx - hx) > abs(fy - hy):  # Prioritize vertical/horizontal closeness
-        if fx < hx and st.session_state.direction != "DOWN":
-            st.session_state.direction = "UP"
-        elif fx > hx and st.session_state.direction != "UP":
-            st.session_state.direction = "DOWN"
-    else:
-        if fy < hy and st.session_state.direction != "RIGHT":
-            st.session_state.direction = "LEFT"
-        elif fy > hy and st.session_state.direction != "LEFT":
-            st.session_state.direction = "RIGHT"
+# 🎞️ Replays of benchmark games
+with st.sidebar:
+    st.subheader("🎞️ Replay a game")
+    replay_file = st.file_uploader("Move log (.snk from snake_bench.py)", type=["snk"])
+    if replay_file is not None and st.button("▶️ Play replay"):
+        try:
+            start_replay(replay_file.getvalue())
+        except ValueError as e:
+            st.error(str(e))
+    if st.session_state.replay is not None:
+        moves, i = st.session_state.replay
+        st.caption(f"Seed {st.session_state.engine.seed} · move {i} / {len(moves)}")
+        st.select_slider("Replay speed (moves per frame)", options=[1, 4, 16, 64], key="replay_speed")
+        if st.button("⏹️ Stop replay"):
+            reset_game()
+            st.session_state.run = False
 
 # -----------------------------
-# UI Layout
+# Human play: game loop runs in the browser
 # -----------------------------
-st.title("🐍 Snake Game in Streamlit (Enhanced with Auto Play)")
+if not st.session_state.auto_play and st.session_state.replay is None:
+    event = snake_client(
+        mode="play",
+        grid_size=GRID_SIZE,
+        speed_ms=int(SPEED * 1000),
+        cell_px=CELL_PX,
+        start=[list(cell) for cell in START_SNAKE],
+        key="snake_client",
+        default=None,
+    )
+    if event:
+        st.session_state.client_score = event["score"]
+        st.session_state.best_score = max(st.session_state.best_score, event["score"])
+
+    col1, col2, col3 = st.columns([1, 1, 2])
+    col1.metric("Score", st.session_state.client_score)
+    col2.metric("Best", st.session_state.best_score)
+    st.caption("Use the arrow keys (or WASD) on the board, or the on-screen pad.")
+    st.stop()
 
+# -----------------------------
+# Auto play: the server steps SnakeEngine and streams the board
+# -----------------------------
 col1, col2, col3 = st.columns([1, 2, 1])
 with col1:
-    st.metric("Score", st.session_state.score)
+    st.metric("Score", st.session_state.engine.score)
 with col3:
     if st.button("🔄 Restart"):
         reset_game()
 
-# 🎮 Auto Play toggle
-st.session_state.auto_play = st.checkbox("🤖 Auto Play", value=st.session_state.auto_play)
-
-# 🎮 Colorful control pad
-st.markdown("""
-<style>
-button[kind="secondary"] {
-    width: 90px !important;
-    height: 50px !important;
-    font-size: 20px !important;
-    font-weight: bold !important;
-    border-radius: 10px !important;
-}
-</style>
-""", unsafe_allow_html=True)
-
-c1, c2, c3 = st.columns(3)
-with c2:
-    if st.button("⬆️ Up", key="up"):
-        if st.session_state.direction != "DOWN":
-            st.session_state.direction = "UP"
-c1, c2, c3 = st.columns(3)
-with c1:
-    if st.button("⬅️ Left", key="left"):
-        if st.session_state.direction != "RIGHT":
-            st.session_state.direction = "LEFT"
-with c3:
-    if st.button("➡️ Right", key="right"):
-        if st.session_state.direction != "LEFT":
-            st.session_state.direction = "RIGHT"
-c1, c2, c3 = st.columns(3)
-with c2:
-    if st.button("⬇️ Down", key="down"):
-        if st.session_state.direction != "UP":
-            st.session_state.direction = "DOWN"
-
-# Game board placeholder
-board_placeholder = st.empty()
+def draw_board(engine):
+    """Send only the cells that changed since the last frame to the board view."""
+    view_event = snake_client(
+        mode="view",
+        grid_size=engine.size,
+        cell_px=CELL_PX,
+        delta=st.session_state.board_delta.update(engine),
+        status=f"Score: {engine.score}",
+        key="snake_view",
+        default=None,
+    )
+    if view_event and view_event.get("event") == "resync" and view_event["seq"] != st.session_state.get("resync_seq"):
+        # the browser lost its frame; make the next update a keyframe
+        st.session_state.resync_seq = view_event["seq"]
+        st.session_state.board_delta.reset()
 
 # -----------------------------
 # Game Loop
 # -----------------------------
-if st.session_state.run and not st.session_state.game_over:
-    while st.session_state.run and not st.session_state.game_over:
-        if st.session_state.auto_play:
-            auto_play_move()
-        move_snake()
-        board_html = draw_board()
-        board_placeholder.markdown(board_html, unsafe_allow_html=True)
+engine = st.session_state.engine
+if st.session_state.run and engine.alive:
+    while st.session_state.run and engine.alive:
+        steps = st.session_state.get("replay_speed", 1) if st.session_state.replay is not None else 1
+        for _ in range(steps):
+            direction = next_direction()
+            if direction is None or not engine.alive:
+                break
+            engine.step(direction)
+        draw_board(engine)
         time.sleep(SPEED)
         st.rerun()
 
 # -----------------------------
 # Game Over Screen
 # -----------------------------
-if st.session_state.game_over:
-    st.error(f"💀 Game Over! Final Score: {st.session_state.score}")
+if st.session_state.replay is not None and not st.session_state.run and engine.alive:
+    draw_board(engine)
+    st.info(f"Replay finished at score {engine.score} after {engine.ticks} moves (game was stopped by the benchmark).")
+
+if not engine.alive:
+    draw_board(engine)
+    if engine.death_cause == BOARD_FULL:
+        st.success(f"🏆 Board cleared! Final Score: {engine.score}")
+    else:
+        st.error(f"💀 Game Over! Final Score: {engine.score}")
     if st.button("Play Again"):
         reset_game()
         st.rerun()
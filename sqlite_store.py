@@ -0,0 +1,33 @@
+# sqlite_store.py
+# Shared SQLite plumbing for the app's small on-disk stores
+# (kitchen_queue.py, rps_stats.py).
+#
+# Connections run in autocommit mode with WAL journaling, so readers never
+# block the writer; writes go through write_transaction(), which takes the
+# write lock up front (BEGIN IMMEDIATE) instead of failing halfway through.
+import sqlite3
+from contextlib import contextmanager
+
+_initialized = set()  # database paths whose schema has been applied in this process
+
+def connect(path, schema: str) -> sqlite3.Connection:
+    """Open `path`, applying `schema` once per process."""
+    path = str(path)
+    conn = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    if path not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(schema)
+        _initialized.add(path)
+    return conn
+
+@contextmanager
+def write_transaction(conn: sqlite3.Connection):
+    """BEGIN IMMEDIATE ... COMMIT, rolled back if the block raises."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
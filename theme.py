@@ -0,0 +1,28 @@
+# theme.py
+# Shared stylesheets for the Streamlit apps.
+#
+# Stylesheets live in static/ and are served once by Streamlit's static file
+# serving (.streamlit/config.toml). Each rerun only emits a short @import
+# whose ?v= query is the file's content hash, so the browser caches the CSS
+# until the file changes instead of receiving it over the websocket again.
+import hashlib
+import os
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATIC_URL = "app/static"
+
+
+@st.cache_data(show_spinner=False)
+def stylesheet_version(path: str, mtime_ns: int) -> str:
+    """Content hash of a stylesheet; `mtime_ns` re-keys the cache when it is edited."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:12]
+
+
+def use_stylesheet(name: str) -> None:
+    """Apply static/<name> to the page."""
+    path = STATIC_DIR / name
+    version = stylesheet_version(str(path), os.stat(path).st_mtime_ns)
+    st.html(f'<style>@import url("{STATIC_URL}/{name}?v={version}");</style>')
@@ -0,0 +1,228 @@
+# tictactoe.py
+# Tic-tac-toe rules and computer players shared by game.py and batch tools.
+#
+# A board is a bitboard pair (x_bits, o_bits): bit i is set when that player
+# holds cell i (cells numbered 0-8, row by row). Win detection, "board full"
+# and the empty-cell list are all table lookups on 9-bit masks.
+import random
+import sys
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+X = '❌'
+O = '⭕'
+
+EMPTY_BOARD = (0, 0)
+FULL = 0x1FF
+
+# Winning combinations
+LINES = [
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # rows
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # columns
+    [0, 4, 8], [2, 4, 6]              # diagonals
+]
+WIN_MASKS = tuple(sum(1 << i for i in line) for line in LINES)
+LINE_OF_MASK = {mask: line for mask, line in zip(WIN_MASKS, LINES)}
+
+def _first_win(bits):
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return mask
+    return 0
+
+# 9-bit mask -> first completed win mask (0 if none)
+WIN_TABLE = tuple(_first_win(bits) for bits in range(FULL + 1))
+# occupied mask -> tuple of empty cell indexes
+EMPTY_CELLS = tuple(tuple(i for i in range(9) if not occ >> i & 1) for occ in range(FULL + 1))
+
+def cell(board, idx):
+    """X, O or None for cell `idx`."""
+    if board[0] >> idx & 1:
+        return X
+    if board[1] >> idx & 1:
+        return O
+    return None
+
+def play(board, idx, player):
+    """Return the board with `player` placed on `idx` (which must be empty)."""
+    bit = 1 << idx
+    return (board[0] | bit, board[1]) if player == X else (board[0], board[1] | bit)
+
+def empty_cells(board):
+    return EMPTY_CELLS[board[0] | board[1]]
+
+def check_winner(board):
+    """Check if there's a winner and return the winner and winning line"""
+    mask = WIN_TABLE[board[0]]
+    if mask:
+        return X, LINE_OF_MASK[mask]
+    mask = WIN_TABLE[board[1]]
+    if mask:
+        return O, LINE_OF_MASK[mask]
+    return None, None
+
+def is_board_full(board):
+    """Check if the board is full"""
+    return board[0] | board[1] == FULL
+
+def other(player):
+    return O if player == X else X
+
+# -------------------------
+# Game state transitions
+# -------------------------
+@dataclass(frozen=True)
+class GameState:
+    """One game plus the running score; replaced, never mutated."""
+    board: tuple = EMPTY_BOARD
+    current_player: str = X
+    winner: str = None          # X, O, "Draw" or None while in play
+    winning_line: tuple = None
+    score: tuple = (0, 0, 0)    # X wins, O wins, draws
+
+    @property
+    def game_over(self) -> bool:
+        return self.winner is not None
+
+    def new_game(self):
+        """Fresh board, same score."""
+        return GameState(score=self.score)
+
+def apply_move(state: GameState, idx: int, rules=None) -> GameState:
+    """The state after the current player takes cell `idx`.
+
+    `rules` supplies play/check_winner/is_board_full for the board in use
+    (this module for 3x3, an mnk_engine.MNKGame otherwise). Moves after the
+    game is over, or onto an occupied cell, leave the state unchanged.
+    """
+    rules = rules or sys.modules[__name__]
+    if state.game_over or (state.board[0] | state.board[1]) >> idx & 1:
+        return state
+    board = rules.play(state.board, idx, state.current_player)
+    winner, line = rules.check_winner(board)
+    x_wins, o_wins, draws = state.score
+    if winner == X:
+        x_wins += 1
+    elif winner == O:
+        o_wins += 1
+    elif rules.is_board_full(board):
+        winner, draws = "Draw", draws + 1
+    else:
+        return replace(state, board=board, current_player=other(state.current_player))
+    return replace(state, board=board, winner=winner, winning_line=tuple(line) if line else None,
+                   score=(x_wins, o_wins, draws))
+
+# -------------------------
+# Perfect-play solver
+# -------------------------
+# Positions are keyed by their base-3 encoding (cell i contributes
+# digit * 3**i, with 0 = empty, 1 = X, 2 = O) reduced to the smallest
+# encoding among the board's 8 rotations/reflections. Each canonical
+# position stores its minimax score for the player to move:
+# +(10 - plies) for a win, -(10 - plies) for a loss, 0 for a draw,
+# so faster wins and slower losses score better.
+SYMMETRIES = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left-right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top-bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti-diagonal
+]
+# 9-bit mask -> sum of 3**i over its set bits
+TERN = tuple(sum(3 ** i for i in range(9) if bits >> i & 1) for bits in range(FULL + 1))
+# per symmetry: 9-bit mask -> transformed mask
+SYM_TABLES = tuple(
+    tuple(sum(1 << dst for dst, src in enumerate(sym) if bits >> src & 1) for bits in range(FULL + 1))
+    for sym in SYMMETRIES
+)
+
+def encode(board) -> int:
+    return TERN[board[0]] + 2 * TERN[board[1]]
+
+def canonical(board) -> int:
+    x, o = board
+    return min(TERN[t[x]] + 2 * TERN[t[o]] for t in SYM_TABLES)
+
+@lru_cache(maxsize=None)
+def solver_table() -> dict:
+    """canonical code -> score for the player to move, for every legal position.
+
+    Built once per process by a memoized search from the empty board
+    (5,478 legal positions, 765 after symmetry reduction).
+    """
+    table = {}
+
+    def solve(board, player, plies):
+        key = canonical(board)
+        if key in table:
+            return table[key]
+        if WIN_TABLE[board[0]] or WIN_TABLE[board[1]]:
+            score = -(10 - plies)  # the previous player just won
+        elif is_board_full(board):
+            score = 0
+        else:
+            score = max(-solve(play(board, i, player), other(player), plies + 1) for i in empty_cells(board))
+        table[key] = score
+        return score
+
+    solve(EMPTY_BOARD, X, 0)
+    return table
+
+@lru_cache(maxsize=None)
+def best_moves(board, player) -> tuple:
+    """Cells with the best solver score, memoized per position (5,478 at most)."""
+    scores = move_scores(board, player)
+    best = max(scores.values(), default=None)
+    return tuple(i for i, s in scores.items() if s == best)
+
+def move_scores(board, player) -> dict:
+    """Empty cell -> score of playing it, from `player`'s point of view."""
+    table = solver_table()
+    return {i: -table[canonical(play(board, i, player))] for i in empty_cells(board)}
+
+# -------------------------
+# Computer players
+# -------------------------
+DIFFICULTIES = {
+    "Easy": 0.0,     # always random
+    "Medium": 0.6,   # perfect move 60% of the time
+    "Unbeatable": 1.0,
+}
+
+def random_move(board, player, rng=random):
+    cells = empty_cells(board)
+    return rng.choice(cells) if cells else None
+
+# rule-of-thumb cell preference once there is nothing to win or block
+HEURISTIC_TIERS = ((4,), (0, 2, 6, 8), (1, 3, 5, 7))
+
+def heuristic_move(board, player, rng=random):
+    """Win if possible, else block, else center, a corner, a side."""
+    cells = empty_cells(board)
+    if not cells:
+        return None
+    mine, theirs = board if player == X else (board[1], board[0])
+    for bits in (mine, theirs):
+        hits = [i for i in cells if WIN_TABLE[bits | 1 << i]]
+        if hits:
+            return rng.choice(hits)
+    for tier in HEURISTIC_TIERS:
+        options = [i for i in tier if i in cells]
+        if options:
+            return rng.choice(options)
+
+def solver_move(board, player, rng=random):
+    """Best move by table lookup; ties are broken at random."""
+    moves = best_moves(board, player)
+    return rng.choice(moves) if moves else None
+
+def computer_move(board, player, difficulty="Unbeatable", rng=random):
+    """Move for `player` at the given difficulty (see DIFFICULTIES)."""
+    if check_winner(board)[0] is not None:
+        return None
+    if rng.random() < DIFFICULTIES[difficulty]:
+        return solver_move(board, player, rng)
+    return random_move(board, player, rng)
@@ -0,0 +1,151 @@
+# tictactoe_tournament.py
+# Batch AI-vs-AI tournament for the tic-tac-toe computer players.
+#
+#   python tictactoe_tournament.py --games 1000000 --workers 8
+#
+# Every ordered pairing of players (each side plays both ❌ and ⭕) is split
+# into seeded chunks and played across a process pool, so results are
+# reproducible for a given --seed whatever the worker count. Games use the
+# same rules and move functions as game.py (tictactoe.py).
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tictactoe import (EMPTY_BOARD, O, X, check_winner, heuristic_move, is_board_full, play, random_move,
+                       solver_move, solver_table)
+
+PLAYERS = {
+    "random": random_move,
+    "heuristic": heuristic_move,
+    "solver": solver_move,
+}
+CHUNK_GAMES = 20_000  # games per pool job
+
+
+def play_game(x_move, o_move, rng) -> tuple:
+    """Play one game; returns (winner or None for a draw, number of moves)."""
+    board, player, moves = EMPTY_BOARD, X, 0
+    while True:
+        move = (x_move if player == X else o_move)(board, player, rng)
+        board = play(board, move, player)
+        moves += 1
+        winner, _ = check_winner(board)
+        if winner is not None:
+            return winner, moves
+        if is_board_full(board):
+            return None, moves
+        player = O if player == X else X
+
+
+def play_chunk(x_name: str, o_name: str, games: int, seed: int) -> dict:
+    """Play `games` seeded games of x_name (❌) against o_name (⭕)."""
+    rng = random.Random(seed)
+    x_move, o_move = PLAYERS[x_name], PLAYERS[o_name]
+    x_wins = o_wins = draws = moves = 0
+    for _ in range(games):
+        winner, n = play_game(x_move, o_move, rng)
+        moves += n
+        if winner == X:
+            x_wins += 1
+        elif winner == O:
+            o_wins += 1
+        else:
+            draws += 1
+    return {"pairing": (x_name, o_name), "x_wins": x_wins, "o_wins": o_wins, "draws": draws, "moves": moves}
+
+
+def _play_chunk_args(args: tuple) -> dict:
+    return play_chunk(*args)
+
+
+def _warm_up():
+    solver_table()  # build the solver table once per worker, not per chunk
+
+
+def run_tournament(players: list, games: int, workers: int, first_seed: int = 0, chunk_games: int = CHUNK_GAMES) -> dict:
+    """Play `games` games for every ordered pairing of `players`.
+
+    Returns per-pairing results keyed (x_player, o_player) and a
+    player-vs-opponent matrix of (wins, draws, losses) over both colors.
+    """
+    jobs = []
+    for x_name in players:
+        for o_name in players:
+            for start in range(0, games, chunk_games):
+                jobs.append((x_name, o_name, min(chunk_games, games - start), first_seed + len(jobs)))
+
+    started = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up) as pool:
+            chunks = list(pool.map(_play_chunk_args, jobs))
+    else:
+        _warm_up()
+        chunks = [_play_chunk_args(job) for job in jobs]
+    wall = time.perf_counter() - started
+
+    pairings = {(x, o): {"x_wins": 0, "o_wins": 0, "draws": 0} for x in players for o in players}
+    moves = 0
+    for chunk in chunks:
+        totals = pairings[chunk["pairing"]]
+        for field in totals:
+            totals[field] += chunk[field]
+        moves += chunk["moves"]
+
+    matrix = {(a, b): [0, 0, 0] for a in players for b in players}
+    for (x, o), r in pairings.items():
+        for seat, won, lost in ((x, r["x_wins"], r["o_wins"]), (o, r["o_wins"], r["x_wins"])):
+            opponent = o if seat == x else x
+            row = matrix[(seat, opponent)]
+            row[0] += won
+            row[1] += r["draws"]
+            row[2] += lost
+
+    total_games = games * len(players) ** 2
+    return {
+        "games": total_games,
+        "wall_seconds": wall,
+        "games_per_sec": total_games / wall if wall else float("inf"),
+        "moves_per_sec": moves / wall if wall else float("inf"),
+        "pairings": pairings,
+        "matrix": {pair: tuple(row) for pair, row in matrix.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play the tic-tac-toe computer players against each other.")
+    parser.add_argument("--games", type=int, default=100_000, help="games per ordered pairing (default: 100000)")
+    parser.add_argument("--players", nargs="+", choices=list(PLAYERS), default=list(PLAYERS))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first chunk; chunks use seed, seed+1, ...")
+    parser.add_argument("--chunk", type=int, default=CHUNK_GAMES, help=f"games per pool job (default: {CHUNK_GAMES})")
+    args = parser.parse_args(argv)
+
+    report = run_tournament(args.players, args.games, args.workers, args.seed, args.chunk)
+    print(f"🎮 {report['games']:,} games · {len(args.players)} players · workers={args.workers}")
+    print(f"   wall time      {report['wall_seconds']:.2f}s")
+    print(f"   throughput     {report['games_per_sec']:,.0f} games/s · {report['moves_per_sec']:,.0f} moves/s")
+
+    print(f"\n   {X + ' vs ' + O:<10}" + "".join(f"{o:>26}" for o in args.players))
+    for x in args.players:
+        cells = []
+        for o in args.players:
+            r = report["pairings"][(x, o)]
+            cells.append(f"{r['x_wins']:>8,}/{r['draws']:,}/{r['o_wins']:,}".rjust(26))
+        print(f"   {x:<10}" + "".join(cells))
+    print(f"   (cells: {X} wins / draws / {O} wins)")
+
+    print("\n   win/draw/loss" + "".join(f"{b:>12}" for b in args.players))
+    for a in args.players:
+        cells = []
+        for b in args.players:
+            w, d, l = report["matrix"][(a, b)]
+            n = w + d + l
+            cells.append(f"{100 * w / n:3.0f}/{100 * d / n:.0f}/{100 * l / n:.0f}%".rjust(12))
+        print(f"   {a:<13}" + "".join(cells))
+    print("   (row player vs column player over both colors)")
+
+
+if __name__ == "__main__":
+    main()
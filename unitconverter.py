@@ -1,5 +1,7 @@
 import streamlit as st
 
+from exchange_rates import get_rate_table
+
 # ---------------------------------
 # Step 1: Page Setup
 # ---------------------------------
@@ -17,19 +19,12 @@ tab1, tab2, tab3, tab4 = st.tabs(["💰 Currency", "🌡️ Temperature", "📏
 # ---------------------------------
 with tab1:
     st.subheader("💰 Currency Converter")
+    rate_table = get_rate_table()  # shared with the currency converter and billing apps
     amount = st.number_input("Enter Amount", min_value=0.0, value=1.0, step=0.5)
-    from_currency = st.selectbox("From Currency", ["USD", "EUR", "INR", "GBP"])
-    to_currency = st.selectbox("To Currency", ["USD", "EUR", "INR", "GBP"])
-
-    # Fixed conversion rates (demo purpose)
-    rates = {
-        "USD": {"EUR": 0.92, "INR": 83.0, "GBP": 0.79, "USD": 1},
-        "EUR": {"USD": 1.09, "INR": 90.0, "GBP": 0.86, "EUR": 1},
-        "INR": {"USD": 0.012, "EUR": 0.011, "GBP": 0.0095, "INR": 1},
-        "GBP": {"USD": 1.27, "EUR": 1.16, "INR": 105.0, "GBP": 1}
-    }
+    from_currency = st.selectbox("From Currency", rate_table.currencies)
+    to_currency = st.selectbox("To Currency", rate_table.currencies)
 
-    result = amount * rates[from_currency][to_currency]
+    result = rate_table.convert(amount, from_currency, to_currency)
     st.success(f"💱 {amount} {from_currency} = {result:.2f} {to_currency}")
 
 # ---------------------------------